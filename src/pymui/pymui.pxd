@@ -377,6 +377,7 @@ cdef extern from "SDL2/SDL.h":
     cdef const int SDLK_RALT     
     cdef const int SDLK_RETURN   
     cdef const int SDLK_BACKSPACE
+    cdef const int SDLK_ESCAPE
 
     cdef void SDL_INIT_EVERYTHING()
 
@@ -389,5 +390,38 @@ cdef extern from "SDL2/SDL.h":
     cdef const int SDL_KEYDOWN
     cdef const int SDL_KEYUP
 
+    # Just the SDL_Event members that input_sdl_event() and run_frame() read
+    ctypedef struct SDL_Keysym:
+        int sym
+
+    ctypedef struct SDL_KeyboardEvent:
+        SDL_Keysym keysym
+
+    ctypedef struct SDL_MouseMotionEvent:
+        int x
+        int y
+
+    ctypedef struct SDL_MouseButtonEvent:
+        unsigned char button
+        int x
+        int y
+
+    ctypedef struct SDL_MouseWheelEvent:
+        int y
+
+    ctypedef struct SDL_TextInputEvent:
+        char text[32]
+
+    ctypedef union SDL_Event:
+        unsigned int type
+        SDL_KeyboardEvent key
+        SDL_MouseMotionEvent motion
+        SDL_MouseButtonEvent button
+        SDL_MouseWheelEvent wheel
+        SDL_TextInputEvent text
+
+    int SDL_PollEvent(SDL_Event* event) nogil
+    int SDL_WaitEventTimeout(SDL_Event* event, int timeout) nogil
+
 
 
@@ -1,6 +1,8 @@
 
 from libc.stdlib cimport malloc, calloc, realloc, free
 from libc.string cimport memcpy, memset, strlen
+cimport cython
+from cpython.buffer cimport PyObject_CheckBuffer
 
 cimport pymui
 
@@ -75,7 +77,9 @@ def color(int r, int g, int b, int a=255) -> Color:
     return Color.from_c(mu_color(r, g, b, a))
 
 
-# Basic struct classes
+# Basic struct classes; several are created per draw command every frame,
+# so each keeps a freelist to recycle instances instead of reallocating
+@cython.freelist(64)
 cdef class Vec2:
     """A 2D vector with integer coordinates.
 
@@ -135,6 +139,7 @@ cdef class Vec2:
         return self._vec
 
 
+@cython.freelist(64)
 cdef class Rect:
     """A rectangle defined by position and dimensions.
 
@@ -217,6 +222,7 @@ cdef class Rect:
         return self._rect
 
 
+@cython.freelist(64)
 cdef class Color:
     """An RGBA color with 8-bit components.
 
@@ -438,6 +444,76 @@ cdef int text_height(mu_Font font) noexcept:
     # return 8  # Python renderer uses 7-pixel height + 1 pixel spacing
 
 
+cdef unsigned long long _hash_commands(mu_Context* ctx) noexcept:
+    """FNV-1a hash of the bytes in the context's command list"""
+    cdef unsigned long long h = 14695981039346656037ULL
+    cdef int i
+    for i in range(ctx.command_list.idx):
+        h = (h ^ <unsigned char>ctx.command_list.items[i]) * 1099511628211ULL
+    return h
+
+
+cdef inline bytes _utf8(object text):
+    """UTF-8 bytes for a str, or the bytes object itself (not re-encoded)"""
+    if type(text) is bytes:
+        return <bytes>text
+    return (<str?>text).encode('utf-8')
+
+
+# SDL -> microui input mappings for Context.input_sdl_event()
+cdef inline int _sdl_button(int button) noexcept nogil:
+    """microui mouse flag for an SDL button id, or 0 if unmapped"""
+    if button == SDL_BUTTON_LEFT:
+        return MU_MOUSE_LEFT
+    if button == SDL_BUTTON_RIGHT:
+        return MU_MOUSE_RIGHT
+    if button == SDL_BUTTON_MIDDLE:
+        return MU_MOUSE_MIDDLE
+    return 0
+
+
+cdef inline int _sdl_key(int sym) noexcept nogil:
+    """microui key flag for an SDL keycode, or 0 if unmapped"""
+    if sym == SDLK_LSHIFT or sym == SDLK_RSHIFT:
+        return MU_KEY_SHIFT
+    if sym == SDLK_LCTRL or sym == SDLK_RCTRL:
+        return MU_KEY_CTRL
+    if sym == SDLK_LALT or sym == SDLK_RALT:
+        return MU_KEY_ALT
+    if sym == SDLK_RETURN:
+        return MU_KEY_RETURN
+    if sym == SDLK_BACKSPACE:
+        return MU_KEY_BACKSPACE
+    return 0
+
+
+cdef unsigned int _forward_sdl_event(mu_Context* ctx, SDL_Event* e) noexcept:
+    """Pass one SDL event to the matching mu_input_* call; returns its type"""
+    cdef unsigned int etype = e.type
+    cdef int btn
+    cdef int key
+    if etype == SDL_MOUSEMOTION:
+        mu_input_mousemove(ctx, e.motion.x, e.motion.y)
+    elif etype == SDL_MOUSEBUTTONDOWN or etype == SDL_MOUSEBUTTONUP:
+        btn = _sdl_button(e.button.button)
+        if btn:
+            if etype == SDL_MOUSEBUTTONDOWN:
+                mu_input_mousedown(ctx, e.button.x, e.button.y, btn)
+            else:
+                mu_input_mouseup(ctx, e.button.x, e.button.y, btn)
+    elif etype == SDL_MOUSEWHEEL:
+        mu_input_scroll(ctx, 0, e.wheel.y * -30)
+    elif etype == SDL_TEXTINPUT:
+        mu_input_text(ctx, e.text.text)
+    elif etype == SDL_KEYDOWN or etype == SDL_KEYUP:
+        key = _sdl_key(e.key.keysym.sym)
+        if key:
+            if etype == SDL_KEYDOWN:
+                mu_input_keydown(ctx, key)
+            else:
+                mu_input_keyup(ctx, key)
+    return etype
+
 
 # Main Context class
 cdef class Context:
@@ -486,11 +562,13 @@ cdef class Context:
     cdef mu_Context* ptr
     cdef bint owner
     cdef mu_Command* current_command
+    cdef unsigned long long _commands_hash
 
     def __cinit__(self):
         self.ptr = NULL
         self.owner = False
         self.current_command = NULL
+        self._commands_hash = 0
 
     def __dealloc__(self):
         # De-allocate if not null and flag is set
@@ -564,6 +642,58 @@ cdef class Context:
         """
         mu_end(self.ptr)
 
+    def stress_cycles(self, int n):
+        """Run n empty begin()/end() frames entirely in C.
+
+        Useful for exercising frame setup/teardown without paying a Python
+        call per frame; the frames contain no widgets.
+
+        Args:
+            n (int): Number of frames to run
+
+        Raises:
+            ValueError: If n is negative
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        cdef int i
+        for i in range(n):
+            mu_begin(self.ptr)
+            mu_end(self.ptr)
+        self.current_command = NULL
+
+    cdef bint _check_commands_changed(self) noexcept:
+        cdef unsigned long long h = _hash_commands(self.ptr)
+        cdef bint changed = h != self._commands_hash
+        self._commands_hash = h
+        return changed
+
+    def commands_changed(self) -> bool:
+        """Check whether the command list changed since the last check.
+
+        The command buffer is hashed here, only when asked, and compared
+        with the hash stored by the previous call. Call it once per frame
+        after end() so callers can skip rendering an unchanged UI.
+
+        Returns:
+            bool: True if the commands differ from those seen by the
+            previous call (always True on the first call)
+        """
+        return self._check_commands_changed()
+
+    def reset(self):
+        """Return the context to its freshly constructed state.
+
+        Re-runs mu_init() on the existing allocation, discarding all
+        containers, pools, focus and input state, so one context can be
+        reused (e.g. across tests) without reallocating it.
+        """
+        mu_init(self.ptr)
+        self.ptr.text_width = text_width
+        self.ptr.text_height = text_height
+        self.current_command = NULL
+        self._commands_hash = 0
+
     def __enter__(self):
         """Enter the context manager - automatically calls begin().
 
@@ -608,6 +738,28 @@ cdef class Context:
             id (int): The widget ID to focus
         """
         mu_set_focus(self.ptr, id)
+
+    def get_focus(self) -> int:
+        """Get the focused widget.
+
+        After end(), this is non-zero only while a control holds focus,
+        e.g. a textbox being edited.
+
+        Returns:
+            int: The focused widget's ID, or 0 if nothing is focused
+        """
+        return self.ptr.focus
+
+    def get_last_id(self) -> int:
+        """Get the ID of the most recently created widget.
+
+        Read it right after a widget call, e.g. to compare a textbox's ID
+        with get_focus().
+
+        Returns:
+            int: The last ID produced by get_id() or a widget
+        """
+        return self.ptr.last_id
     
     def get_id(self, data) -> int:
         """Get an ID for the given data.
@@ -695,6 +847,29 @@ cdef class Context:
         """Handle text input"""
         cdef bytes btext = text.encode('utf-8')
         mu_input_text(self.ptr, btext)
+
+    def input_sdl_event(self, size_t event_addr) -> int:
+        """Forward a raw SDL_Event to microui in a single call.
+
+        The event union is decoded in C: mouse motion, buttons, wheel,
+        text input and the modifier/Return/Backspace keys are passed to
+        the matching mu_input_* function, with the same mappings the SDL
+        scripts use. Other event types are left to the caller.
+
+        Args:
+            event_addr (int): Address of an SDL_Event, e.g.
+                ``ctypes.addressof(event)``
+
+        Returns:
+            int: The event's SDL type, so callers can still handle
+            SDL_QUIT, Escape and the like
+
+        Raises:
+            ValueError: If event_addr is 0 (NULL)
+        """
+        if event_addr == 0:
+            raise ValueError("event_addr must not be NULL")
+        return _forward_sdl_event(self.ptr, <SDL_Event*>event_addr)
     
     # Layout functions
     # def layout_row(self, int items, widths, int height):
@@ -760,23 +935,23 @@ cdef class Context:
 
         mu_text(self.ptr, btext)
     
-    def label(self, str text):
-        """Draw a label"""
-        cdef bytes btext = text.encode('utf-8')
+    def label(self, text):
+        """Draw a label (str, or UTF-8 bytes passed through unencoded)"""
+        cdef bytes btext = _utf8(text)
         mu_label(self.ptr, btext)
     
-    def button(self, str label, int icon=0, int opt=0) -> int:
-        """Create a button"""
-        cdef bytes blabel = label.encode('utf-8')
+    def button(self, label, int icon=0, int opt=0) -> int:
+        """Create a button (label may be pre-encoded UTF-8 bytes)"""
+        cdef bytes blabel = _utf8(label)
         return mu_button_ex(self.ptr, blabel, icon, opt)
     
-    def checkbox(self, str label, state) -> tuple:
+    def checkbox(self, label, state) -> tuple:
         """Create a checkbox - returns (result, new_state)"""
         cdef bytes blabel
         cdef int c_state
         cdef int result
         
-        blabel = label.encode('utf-8')
+        blabel = _utf8(label)
         c_state = int(state)
         result = mu_checkbox(self.ptr, blabel, &c_state)
         return (result, c_state)
@@ -862,6 +1037,36 @@ cdef class Context:
         return (result, c_value)
     
     
+    def slider_row(self, float[::1] values, float low, float high, int width,
+                   float step=0, str fmt="%.2f", int opt=0) -> int:
+        """Lay out one slider per value in a single call.
+
+        Each slider is given the layout width ``width`` and edits its
+        element of ``values`` in place, so a row of sliders over a
+        persistent ``array('f', ...)`` costs one Python call per frame.
+        Because every slider points into the buffer, each keeps its own
+        stable id across frames.
+
+        Args:
+            values: Writable contiguous float32 buffer, e.g. ``array('f')``
+            low (float): Minimum slider value
+            high (float): Maximum slider value
+            width (int): Layout width of each slider
+            step (float, optional): Step size. Defaults to 0.
+            fmt (str, optional): Value format. Defaults to "%.2f".
+            opt (int, optional): Options flags. Defaults to 0.
+
+        Returns:
+            int: Result flags of all the sliders ORed together
+        """
+        cdef bytes bfmt = fmt.encode('utf-8')
+        cdef Py_ssize_t i
+        cdef int result = 0
+        for i in range(values.shape[0]):
+            mu_layout_width(self.ptr, width)
+            result |= mu_slider_ex(self.ptr, &values[i], low, high, step, bfmt, opt)
+        return result
+
     def number(self, float value, float step, str fmt="%.2f", int opt=0) -> tuple:
         """Create a number input - returns (result, new_value)"""
         cdef bytes bfmt
@@ -1054,12 +1259,44 @@ cdef class Context:
         else:
             # Return a base command for unknown types
             return BaseCommand.from_c(self.current_command.base)
+
+    def iter_commands(self):
+        """Iterate over the command list as (type, args) tuples.
+
+        Each command is decoded once into plain values whose order matches
+        the corresponding renderer function, so a caller can dispatch with
+        ``handlers[cmd_type](*args)``:
+
+            TEXT: (text_bytes, pos, color)
+            RECT: (rect, color)
+            ICON: (icon_id, rect, color)
+            CLIP: (rect,)
+
+        JUMP commands are followed internally and never yielded. Iteration
+        is independent of next_command()/reset_command_iterator().
+
+        Yields:
+            tuple: (Command type, tuple of arguments)
+        """
+        cdef mu_Command* cmd = NULL
+        while mu_next_command(self.ptr, &cmd):
+            if cmd.type == MU_COMMAND_TEXT:
+                yield MU_COMMAND_TEXT, (<bytes>cmd.text.str, Vec2.from_c(cmd.text.pos),
+                                        Color.from_c(cmd.text.color))
+            elif cmd.type == MU_COMMAND_RECT:
+                yield MU_COMMAND_RECT, (Rect.from_c(cmd.rect.rect), Color.from_c(cmd.rect.color))
+            elif cmd.type == MU_COMMAND_ICON:
+                yield MU_COMMAND_ICON, (cmd.icon.id, Rect.from_c(cmd.icon.rect),
+                                        Color.from_c(cmd.icon.color))
+            elif cmd.type == MU_COMMAND_CLIP:
+                yield MU_COMMAND_CLIP, (Rect.from_c(cmd.clip.rect),)
     
     def layout_row(self, widths, int height):
         """Set up a row layout with specific widths.
 
         Args:
-            widths: List or tuple of column widths, or None for default
+            widths: List or tuple of column widths, a contiguous C int
+                buffer such as ``array('i', ...)``, or None for default
             height (int): Row height in pixels
 
         Raises:
@@ -1070,9 +1307,21 @@ cdef class Context:
         cdef int items = 0
         cdef int i
         cdef size_t allocation_size
+        cdef const int[::1] width_view
+        cdef bint owned = True
 
         if widths is not None:
-            if isinstance(widths, (list, tuple)):
+            if PyObject_CheckBuffer(widths):
+                # Int buffers are read in place; a layout built once can be
+                # passed every frame without copying
+                width_view = widths
+                items = width_view.shape[0]
+                if items > 1000:  # Reasonable limit
+                    raise ValueError("Too many width entries (max 1000)")
+                if items > 0:
+                    width_array = <int*>&width_view[0]
+                owned = False
+            elif isinstance(widths, (list, tuple)):
                 items = len(widths)
 
                 # Validate array size to prevent overflow
@@ -1102,11 +1351,13 @@ cdef class Context:
         try:
             mu_layout_row(self.ptr, items, width_array, height)
         finally:
-            if width_array != NULL:
+            if owned and width_array != NULL:
                 free(width_array)
 
 
-# Window context manager class
+# Window context manager class; ctx.window() makes one per window per
+# frame, so freed wrappers are recycled through a freelist
+@cython.freelist(8)
 cdef class Window:
     """Context manager for microui windows.
 
@@ -1224,7 +1475,8 @@ cdef class ContainerWrapper:
         return self.ptr.open
 
 
-# Command wrapper classes
+# Command wrapper classes; next_command() makes one per command
+@cython.freelist(8)
 cdef class BaseCommand:
     cdef mu_BaseCommand _cmd
     
@@ -1243,6 +1495,7 @@ cdef class BaseCommand:
         return self._cmd.size
 
 
+@cython.freelist(8)
 cdef class RectCommand:
     cdef mu_RectCommand _cmd
     
@@ -1265,6 +1518,7 @@ cdef class RectCommand:
         return Color.from_c(self._cmd.color)
 
 
+@cython.freelist(8)
 cdef class TextCommand:
     cdef mu_TextCommand* _cmd
     
@@ -1320,7 +1574,15 @@ cdef class TextCommand:
         except Exception:
             return ""
 
+    @property
+    def text_bytes(self) -> bytes:
+        """Raw UTF-8 text as stored by microui, without decoding"""
+        if self._cmd.str == NULL:
+            return b""
+        return <bytes>self._cmd.str
+
 
+@cython.freelist(8)
 cdef class IconCommand:
     cdef mu_IconCommand _cmd
     
@@ -1347,6 +1609,7 @@ cdef class IconCommand:
         return Color.from_c(self._cmd.color)
 
 
+@cython.freelist(8)
 cdef class ClipCommand:
     cdef mu_ClipCommand _cmd
     
@@ -1365,6 +1628,7 @@ cdef class ClipCommand:
         return Rect.from_c(self._cmd.rect)
 
 
+@cython.freelist(8)
 cdef class JumpCommand:
     cdef mu_JumpCommand _cmd
     
@@ -1585,9 +1849,10 @@ def renderer_draw_rect(Rect rect, Color color):
     """Draw a rectangle"""
     r_draw_rect(rect.to_c(), color.to_c())
 
-def renderer_draw_text(str text, Vec2 pos, Color color):
-    """Draw text"""
-    r_draw_text(text.encode(), pos.to_c(), color.to_c())
+def renderer_draw_text(text, Vec2 pos, Color color):
+    """Draw text (str, or UTF-8 bytes passed through unencoded)"""
+    cdef bytes btext = _utf8(text)
+    r_draw_text(btext, pos.to_c(), color.to_c())
 
 def renderer_draw_icon(int icon_id, Rect rect, Color color):
     """Draw an icon"""
@@ -1613,3 +1878,92 @@ def renderer_present():
     """Present the rendered frame"""
     r_present()
 
+def render_all_commands(Context ctx) -> int:
+    """Render every command in the context's command list.
+
+    The command list is walked in C and each command is passed straight to
+    the renderer, avoiding a Python round-trip per command. Call this after
+    end() and between renderer_clear() and renderer_present().
+
+    Args:
+        ctx (Context): The microui context whose frame has ended
+
+    Returns:
+        int: Number of commands drawn (JUMP commands are not counted)
+    """
+    return _draw_commands(ctx.ptr)
+
+
+cdef int _draw_commands(mu_Context* ctx) noexcept:
+    """Walk the command list and draw each command; returns the count"""
+    cdef mu_Command* cmd = NULL
+    cdef int count = 0
+    while mu_next_command(ctx, &cmd):
+        count += 1
+        if cmd.type == MU_COMMAND_TEXT:
+            r_draw_text(cmd.text.str, cmd.text.pos, cmd.text.color)
+        elif cmd.type == MU_COMMAND_RECT:
+            r_draw_rect(cmd.rect.rect, cmd.rect.color)
+        elif cmd.type == MU_COMMAND_ICON:
+            r_draw_icon(cmd.icon.id, cmd.icon.rect, cmd.icon.color)
+        elif cmd.type == MU_COMMAND_CLIP:
+            r_set_clip_rect(cmd.clip.rect)
+    return count
+
+
+def run_frame(Context ctx, on_ui, Color clear, bint force=False, int idle_wait_ms=16) -> bool:
+    """Run one complete SDL frame, calling back into Python only for the UI.
+
+    Pending SDL events are polled and forwarded to microui in C (as with
+    Context.input_sdl_event()), then on_ui(ctx) builds the UI between
+    begin() and end(); end() runs even if on_ui raises. The frame is drawn
+    and presented only when its command list changed, or when force is
+    set. A frame that is unchanged and had no input instead blocks in
+    SDL_WaitEventTimeout() for up to idle_wait_ms, so a bare loop over
+    run_frame() idles rather than spinning; the awaited event stays queued
+    for the next call. Frames that had input never wait, since microui
+    shows hover a frame after the input that caused it.
+
+    Args:
+        ctx (Context): The microui context
+        on_ui: Called as on_ui(ctx) to build the frame's UI
+        clear (Color): Background color
+        force (bool): Present the frame even if the commands are unchanged
+        idle_wait_ms (int): Longest wait for input after an unchanged
+            frame; 0 returns immediately
+
+    Returns:
+        bool: False once SDL_QUIT or Escape was received, True otherwise
+
+    Example:
+        >>> bg = pymui.color(64, 64, 64, 255)
+        >>> while pymui.run_frame(ctx, build_ui, bg):
+        ...     pass
+    """
+    cdef SDL_Event event
+    cdef unsigned int etype
+    cdef bint running = True
+    cdef bint had_input = False
+    while SDL_PollEvent(&event):
+        had_input = True
+        etype = _forward_sdl_event(ctx.ptr, &event)
+        if etype == SDL_QUIT:
+            running = False
+        elif etype == SDL_KEYDOWN and event.key.keysym.sym == SDLK_ESCAPE:
+            running = False
+
+    mu_begin(ctx.ptr)
+    ctx.current_command = NULL
+    try:
+        on_ui(ctx)
+    finally:
+        mu_end(ctx.ptr)
+
+    if ctx._check_commands_changed() or force:
+        r_clear(clear.to_c())
+        _draw_commands(ctx.ptr)
+        r_present()
+    elif running and not had_input and idle_wait_ms > 0:
+        with nogil:
+            SDL_WaitEventTimeout(NULL, idle_wait_ms)
+    return running
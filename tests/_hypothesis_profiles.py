@@ -0,0 +1,46 @@
+"""
+Hypothesis settings profiles for the property-based test modules.
+
+Imported by each Hypothesis test module right after importorskip, so
+Hypothesis is only loaded when such a module is collected; conftest.py
+stays free of it for runs that only touch the plain unit tests. The
+profile must be loaded before the module body creates @given/@settings
+objects, which snapshot the defaults in force at that point.
+
+Profiles, selected with HYPOTHESIS_PROFILE:
+  fast (default) - few examples and no deadline for quick local runs
+  ci             - more examples for thorough runs
+  perf           - replays the same examples every run and skips the
+                   example database, for timing runs
+
+fast and ci share one example database at the repository root, so failing
+examples replay regardless of the working directory; cache .hypothesis/
+between CI runs to keep them.
+"""
+
+import os
+from pathlib import Path
+
+from hypothesis import HealthCheck, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+_examples_db = DirectoryBasedExampleDatabase(
+    str(Path(__file__).parent.parent / ".hypothesis" / "examples"))
+
+settings.register_profile(
+    "fast",
+    max_examples=25,
+    deadline=None,
+    database=_examples_db,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile("ci", max_examples=200, deadline=None, database=_examples_db)
+settings.register_profile(
+    "perf",
+    derandomize=True,
+    database=None,
+    deadline=None,
+    max_examples=50,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.function_scoped_fixture],
+)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "fast"))
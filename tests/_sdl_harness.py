@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Shared SDL main loop for the interactive pymui test scripts.
+
+The harness owns SDL/renderer setup, the batched event drain, input
+forwarding, the dirty-flag redraw and frame pacing. Scripts supply a
+per-frame UI function and optional hooks for their own debug output.
+"""
+
+import sys
+import time
+import ctypes
+import sdl2
+from pathlib import Path
+
+ROOTDIR = Path(__file__).parent.parent / "src"
+
+try:
+    from pymui import pymui
+except ImportError:
+    sys.path.insert(0, str(ROOTDIR))
+    from pymui import pymui
+
+
+# Events are drained in batches after a single SDL_PumpEvents() per frame
+_EVT_BATCH = 32
+_EVT_BUF = (sdl2.SDL_Event * _EVT_BATCH)()
+_peep_events = sdl2.SDL_PeepEvents
+
+# Event types the loop never handles; disabled so SDL does not queue them
+_IGNORED_EVENTS = (
+    sdl2.SDL_JOYAXISMOTION, sdl2.SDL_JOYBALLMOTION, sdl2.SDL_JOYHATMOTION,
+    sdl2.SDL_JOYBUTTONDOWN, sdl2.SDL_JOYBUTTONUP,
+    sdl2.SDL_JOYDEVICEADDED, sdl2.SDL_JOYDEVICEREMOVED,
+    sdl2.SDL_CONTROLLERAXISMOTION, sdl2.SDL_CONTROLLERBUTTONDOWN,
+    sdl2.SDL_CONTROLLERBUTTONUP, sdl2.SDL_CONTROLLERDEVICEADDED,
+    sdl2.SDL_CONTROLLERDEVICEREMOVED,
+    sdl2.SDL_FINGERDOWN, sdl2.SDL_FINGERUP, sdl2.SDL_FINGERMOTION,
+    sdl2.SDL_MULTIGESTURE, sdl2.SDL_SENSORUPDATE, sdl2.SDL_SYSWMEVENT,
+    sdl2.SDL_DROPFILE, sdl2.SDL_DROPTEXT, sdl2.SDL_DROPBEGIN, sdl2.SDL_DROPCOMPLETE,
+)
+
+# Byte offset of the text payload within SDL_Event (text is a union member at 0)
+_TEXTINPUT_OFFSET = sdl2.SDL_TextInputEvent.text.offset
+
+# Frames still built after input even if the commands look unchanged;
+# microui updates hover/focus state one frame late
+_SETTLE_FRAMES = 2
+
+# Frame pacing: sleep to the display refresh rate (60 Hz if unknown)
+FRAME_NS = 16_666_667
+
+# SDL button mapping
+button_map = {
+    sdl2.SDL_BUTTON_LEFT: pymui.Mouse.LEFT,
+    sdl2.SDL_BUTTON_RIGHT: pymui.Mouse.RIGHT,
+    sdl2.SDL_BUTTON_MIDDLE: pymui.Mouse.MIDDLE,
+}
+
+# SDL key mapping
+key_map = {
+    sdl2.SDLK_LSHIFT: pymui.Key.SHIFT,
+    sdl2.SDLK_RSHIFT: pymui.Key.SHIFT,
+    sdl2.SDLK_LCTRL: pymui.Key.CTRL,
+    sdl2.SDLK_RCTRL: pymui.Key.CTRL,
+    sdl2.SDLK_LALT: pymui.Key.ALT,
+    sdl2.SDLK_RALT: pymui.Key.ALT,
+    sdl2.SDLK_RETURN: pymui.Key.RETURN,
+    sdl2.SDLK_BACKSPACE: pymui.Key.BACKSPACE,
+    sdl2.SDLK_ESCAPE: pymui.Key.BACKSPACE,  # Use backspace for escape for now
+}
+
+# SDL button ids are small (1..5), so index a tuple directly; SDL keycodes
+# are sparse, so key_map stays a dict with .get bound in run_loop()
+_BTN_LUT = tuple(button_map.get(i, 0) for i in range(6))
+
+
+def disable_unused_events():
+    """Stop SDL from queueing the event types no script handles (call after SDL_Init)"""
+    for event_type in _IGNORED_EVENTS:
+        sdl2.SDL_EventState(event_type, sdl2.SDL_DISABLE)
+
+
+def frame_interval_ns():
+    """Nanoseconds per frame for the primary display's refresh rate"""
+    mode = sdl2.SDL_DisplayMode()
+    if sdl2.SDL_GetCurrentDisplayMode(0, ctypes.byref(mode)) == 0 and mode.refresh_rate > 0:
+        return 1_000_000_000 // mode.refresh_rate
+    return FRAME_NS
+
+
+def run_loop(ui_fn, *, max_frames=None, clear=(64, 64, 64, 255),
+             on_event=None, on_frame=None):
+    """Run an SDL window driving ui_fn until quit, Escape or max_frames.
+
+    Args:
+        ui_fn: Called as ui_fn(ctx) between ctx.begin() and ctx.end()
+        max_frames (int): Stop after this many loop iterations, or None
+        clear (tuple): RGBA background color
+        on_event: Called as on_event(event) for every drained SDL event,
+            before it is forwarded to microui
+        on_frame: Called as on_frame(frame, cmd_count) after every loop
+            iteration; cmd_count is 0 for frames that were not redrawn
+
+    Returns:
+        int: Process exit code, 0 on success
+    """
+    # Initialize only video and events; joystick/haptic/audio are unused
+    if sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO | sdl2.SDL_INIT_EVENTS) != 0:
+        print(f"SDL_Init Error: {sdl2.SDL_GetError()}")
+        return 1
+    disable_unused_events()
+
+    try:
+        print("Initializing renderer...")
+        pymui.renderer_init()
+        print("Creating context...")
+        ctx = pymui.Context()
+        bg = pymui.color(*clear)
+
+        # Bind SDL constants and context methods to locals for the event loop
+        QUIT = sdl2.SDL_QUIT
+        KEYDOWN = sdl2.SDL_KEYDOWN
+        KEYUP = sdl2.SDL_KEYUP
+        MMOTION = sdl2.SDL_MOUSEMOTION
+        MWHEEL = sdl2.SDL_MOUSEWHEEL
+        MBDOWN = sdl2.SDL_MOUSEBUTTONDOWN
+        MBUP = sdl2.SDL_MOUSEBUTTONUP
+        TEXTIN = sdl2.SDL_TEXTINPUT
+        ESC = sdl2.SDLK_ESCAPE
+        mmove = ctx.input_mousemove
+        mdown = ctx.input_mousedown
+        mup = ctx.input_mouseup
+        scroll = ctx.input_scroll
+        text_in = ctx.input_text
+        kdown = ctx.input_keydown
+        kup = ctx.input_keyup
+        btn_lut = _BTN_LUT
+        key_get = key_map.get
+
+        running = True
+        frame_count = 0
+        frame_ns = frame_interval_ns()
+        frame_ms = max(1, frame_ns // 1_000_000)
+        next_tick = time.monotonic_ns()
+        dirty = True
+        settle = 0
+        while running and (max_frames is None or frame_count < max_frames):
+            frame_count += 1
+
+            # When idle, block until input arrives (or one frame elapses)
+            # rather than sleeping on the frame schedule; the event stays
+            # queued for the drain below, and pacing restarts from now so
+            # the first frame after input is not delayed
+            if not dirty:
+                sdl2.SDL_WaitEventTimeout(None, frame_ms)
+                next_tick = time.monotonic_ns() - frame_ns
+
+            # Handle SDL events; motion is coalesced to the last position
+            # and scroll is summed, both forwarded once per frame
+            last_motion = None
+            scroll_dy = 0
+            sdl2.SDL_PumpEvents()
+            while True:
+                n = _peep_events(_EVT_BUF, _EVT_BATCH, sdl2.SDL_GETEVENT,
+                                 sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT)
+                if n < 0:
+                    print(f"SDL_PeepEvents Error: {sdl2.SDL_GetError()}")
+                    break
+                if n:
+                    dirty = True
+                    settle = _SETTLE_FRAMES
+                for i in range(n):
+                    event = _EVT_BUF[i]
+                    if on_event is not None:
+                        on_event(event)
+                    etype = event.type
+                    if etype == QUIT:
+                        print("Quit event received")
+                        running = False
+                    elif etype == KEYDOWN and event.key.keysym.sym == ESC:
+                        print("Escape key pressed")
+                        running = False
+                    elif etype == MMOTION:
+                        last_motion = (event.motion.x, event.motion.y)
+                    elif etype == MWHEEL:
+                        scroll_dy += event.wheel.y * -30
+                    elif etype == TEXTIN:
+                        # Read the NUL-terminated payload straight from the event buffer
+                        text = ctypes.string_at(ctypes.addressof(event) + _TEXTINPUT_OFFSET).decode('utf-8', 'replace')
+                        text_in(text)
+                    elif etype == MBDOWN or etype == MBUP:
+                        b = event.button.button
+                        btn = btn_lut[b] if b < len(btn_lut) else 0
+                        if btn:
+                            if etype == MBDOWN:
+                                mdown(event.button.x, event.button.y, btn)
+                            else:
+                                mup(event.button.x, event.button.y, btn)
+                            last_motion = None  # button events also move the cursor
+                    elif etype == KEYDOWN or etype == KEYUP:
+                        key = key_get(event.key.keysym.sym)
+                        if key:
+                            if etype == KEYDOWN:
+                                kdown(key)
+                            else:
+                                kup(key)
+                if n < _EVT_BATCH:
+                    break
+            if last_motion is not None:
+                mmove(*last_motion)
+            if scroll_dy:
+                scroll(0, scroll_dy)
+
+            # Rebuild and redraw only after input or until the UI settles
+            # (a widget state change shows up as a changed command list,
+            # though hover lags its input by a frame)
+            cmd_count = 0
+            if dirty:
+                ctx.begin()
+                ui_fn(ctx)
+                ctx.end()
+
+                pymui.renderer_clear(bg)
+                # The command walk and per-type dispatch both run in C
+                cmd_count = pymui.render_all_commands(ctx)
+                pymui.renderer_present()
+                # Keep building while the commands change, and for at least
+                # _SETTLE_FRAMES frames after input
+                settle -= 1
+                dirty = ctx.commands_changed() or settle > 0
+
+            if on_frame is not None:
+                on_frame(frame_count, cmd_count)
+
+            # Sleep until the next frame boundary, resyncing after stalls
+            next_tick += frame_ns
+            delay = next_tick - time.monotonic_ns()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+            elif delay < -frame_ns:
+                next_tick = time.monotonic_ns()
+
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    finally:
+        sdl2.SDL_Quit()
+
+    return 0
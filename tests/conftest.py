@@ -28,4 +28,25 @@ def clean_ctx():
     """Provide a fresh pymui Context for each test that needs isolation."""
     context = pymui.Context()
     yield context
-    # Context cleanup happens automatically via __dealloc__
\ No newline at end of file
+    # Context cleanup happens automatically via __dealloc__
+
+
+@pytest.fixture(scope="module")
+def _module_ctx():
+    """Provide the single Context behind shared_ctx for one test module."""
+    context = pymui.Context()
+    return context
+
+
+@pytest.fixture
+def shared_ctx(_module_ctx):
+    """Provide a module-wide pymui Context, reset before each test."""
+    _module_ctx.reset()
+    return _module_ctx
+
+
+@pytest.fixture(scope="session")
+def renderer():
+    """Initialize the SDL/GL renderer once for every test that draws."""
+    pymui.renderer_init()
+    yield
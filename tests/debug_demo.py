@@ -4,8 +4,8 @@ import sys
 
 try:
     print("Starting debug demo...")
+    import ctypes
     import sdl2
-    import sdl2.ext
     from pymui import pymui
 
     print("Imports successful")
@@ -28,13 +28,16 @@ try:
     print("Starting main loop...")
     frame_count = 0
 
+    # SDL_PollEvent overwrites the event in place, so allocate it once
+    event = sdl2.SDL_Event()
+    event_ref = ctypes.byref(event)
+
     while frame_count < 10:  # Just run for 10 frames for testing
         frame_count += 1
         print(f"Frame {frame_count}")
 
         # Handle SDL events
-        events = sdl2.ext.get_events()
-        for event in events:
+        while sdl2.SDL_PollEvent(event_ref):
             if event.type == sdl2.SDL_QUIT:
                 print("Quit event received")
                 sys.exit(0)
@@ -57,10 +60,7 @@ try:
         # Process commands
         ctx.reset_command_iterator()
         cmd_count = 0
-        while True:
-            cmd = ctx.next_command()
-            if cmd is None:
-                break
+        for cmd in iter(ctx.next_command, None):
             cmd_count += 1
 
         print(f"  Processed {cmd_count} commands")
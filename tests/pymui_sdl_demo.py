@@ -16,9 +16,13 @@ except ImportError:
     from pymui import pymui
 
 
+# Byte offset of the text payload within SDL_Event (text is a union member at 0)
+_TEXTINPUT_OFFSET = sdl2.SDL_TextInputEvent.text.offset
+
 # Global state
 logbuf = []
 logbuf_updated = False
+log_text = ""  # logbuf joined for display, rebuilt by write_log()
 bg = [90.0, 95.0, 100.0]  # Background color RGB
 
 # Persistent state for checkboxes (equivalent to static variables in C)
@@ -32,10 +36,11 @@ checkbox_state = {
 
 def write_log(text):
     """Add text to the log buffer"""
-    global logbuf_updated
+    global logbuf_updated, log_text
     logbuf.append(text)
     if len(logbuf) > 100:  # Keep log manageable
         logbuf.pop(0)
+    log_text = "\n".join(logbuf)
     logbuf_updated = True
 
 
@@ -190,7 +195,6 @@ def log_window(ctx):
         ctx.begin_panel("Log Output")
         panel = ctx.get_current_container()
         ctx.layout_row([-1], -1)
-        log_text = "\n".join(logbuf) if logbuf else ""
         ctx.text(log_text)
         ctx.end_panel()
 
@@ -313,6 +317,13 @@ key_map = {
     sdl2.SDLK_BACKSPACE: pymui.Key.BACKSPACE,
 }
 
+# Event-loop lookup helpers: SDL button ids are small (1..5), so index a
+# tuple directly; SDL keycodes are sparse, so keep the dict but bind .get once
+_BTN_LUT = tuple(button_map.get(i, 0) for i in range(6))
+_key_get = key_map.get
+_MOUSEBUTTON_EVENTS = frozenset((sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP))
+_KEY_EVENTS = frozenset((sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP))
+
 
 def main():
     """Main function"""
@@ -332,10 +343,14 @@ def main():
 
         # Main loop
         running = True
+        # SDL_PollEvent overwrites the event in place, so allocate it once
+        event = sdl2.SDL_Event()
+        event_ref = ctypes.byref(event)
+        # The text payload always sits at the same address in the reused event
+        text_addr = ctypes.addressof(event) + _TEXTINPUT_OFFSET
         while running:
             # Handle SDL events - use direct SDL_PollEvent like C version
-            event = sdl2.SDL_Event()
-            while sdl2.SDL_PollEvent(ctypes.byref(event)):
+            while sdl2.SDL_PollEvent(event_ref):
                 if event.type == sdl2.SDL_QUIT:
                     running = False
                 elif event.type == sdl2.SDL_MOUSEMOTION:
@@ -343,23 +358,19 @@ def main():
                 elif event.type == sdl2.SDL_MOUSEWHEEL:
                     ctx.input_scroll(0, event.wheel.y * -30)
                 elif event.type == sdl2.SDL_TEXTINPUT:
-                    # Convert bytes to string properly
-                    text_bytes = event.text.text
-                    # Find null terminator
-                    null_pos = text_bytes.find(b'\x00')
-                    if null_pos >= 0:
-                        text_bytes = text_bytes[:null_pos]
-                    text = text_bytes.decode('utf-8', errors='replace')
+                    # Read the NUL-terminated payload straight from the event buffer
+                    text = ctypes.string_at(text_addr).decode('utf-8', 'replace')
                     ctx.input_text(text)
-                elif event.type in (sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP):
-                    btn = button_map.get(event.button.button)
+                elif event.type in _MOUSEBUTTON_EVENTS:
+                    b = event.button.button
+                    btn = _BTN_LUT[b] if b < len(_BTN_LUT) else 0
                     if btn:
                         if event.type == sdl2.SDL_MOUSEBUTTONDOWN:
                             ctx.input_mousedown(event.button.x, event.button.y, btn)
                         else:
                             ctx.input_mouseup(event.button.x, event.button.y, btn)
-                elif event.type in (sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP):
-                    key = key_map.get(event.key.keysym.sym)
+                elif event.type in _KEY_EVENTS:
+                    key = _key_get(event.key.keysym.sym)
                     if key:
                         if event.type == sdl2.SDL_KEYDOWN:
                             ctx.input_keydown(key)
@@ -372,21 +383,8 @@ def main():
             # Render
             pymui.renderer_clear(pymui.color(int(bg[0]), int(bg[1]), int(bg[2]), 255))
 
-            # Process commands
-            ctx.reset_command_iterator()
-            while True:
-                cmd = ctx.next_command()
-                if cmd is None:
-                    break
-
-                if cmd.type == pymui.Command.TEXT:
-                    pymui.renderer_draw_text(cmd.text, cmd.pos, cmd.color)
-                elif cmd.type == pymui.Command.RECT:
-                    pymui.renderer_draw_rect(cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.ICON:
-                    pymui.renderer_draw_icon(cmd.icon_id, cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.CLIP:
-                    pymui.renderer_set_clip_rect(cmd.rect)
+            # Walk the command list in C and draw each command directly
+            pymui.render_all_commands(ctx)
 
             pymui.renderer_present()
 
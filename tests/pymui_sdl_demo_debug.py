@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 
+import logging
+import os
+import struct
 import sys
+import time
 from pathlib import Path
 import ctypes
 import sdl2
@@ -16,20 +20,32 @@ except ImportError:
     from pymui import pymui
 
 
+# Per-event debug output is off by default; set PYMUI_DEBUG=1 to enable it
+DEBUG = os.environ.get("PYMUI_DEBUG") == "1"
+log = logging.getLogger(__name__)
+
+# pymui enum values used every frame, bound once
+_RES_CHANGE = pymui.Result.CHANGE
+_RES_SUBMIT = pymui.Result.SUBMIT
+_OPT_EXPANDED = pymui.Option.EXPANDED
+
 # Global state
 logbuf = []
 logbuf_updated = False
+log_text = ""  # logbuf joined for display, rebuilt by write_log()
 bg = [90.0, 95.0, 100.0]  # Background color RGB
 
 
 def write_log(text):
     """Add text to the log buffer"""
-    global logbuf_updated
+    global logbuf_updated, log_text
     logbuf.append(text)
     if len(logbuf) > 100:  # Keep log manageable
         logbuf.pop(0)
+    log_text = "\n".join(logbuf)
     logbuf_updated = True
-    print(f"LOG: {text}")  # Debug output
+    if DEBUG:
+        log.debug("LOG: %s", text)
 
 
 def test_window(ctx):
@@ -57,7 +73,7 @@ def test_window(ctx):
                 ctx.label(f"{win.rect.w}, {win.rect.h}")
 
         # Test Buttons section
-        if ctx.header("Test Buttons", pymui.Option.EXPANDED):
+        if ctx.header("Test Buttons", _OPT_EXPANDED):
             ctx.layout_row([86, -110, -1], 0)
             ctx.label("Test buttons 1:")
             if ctx.button("Button 1"):
@@ -75,7 +91,7 @@ def test_window(ctx):
                 ctx.end_popup()
 
         # Tree and Text section
-        if ctx.header("Tree and Text", pymui.Option.EXPANDED):
+        if ctx.header("Tree and Text", _OPT_EXPANDED):
             ctx.layout_row([140, -1], 0)
             ctx.layout_begin_column()
 
@@ -106,12 +122,9 @@ def test_window(ctx):
 
             if ctx.begin_treenode("Test 3"):
                 # Note: checkbox returns (result, new_state)
-                result, checks_0 = ctx.checkbox("Checkbox 1", getattr(test_window, 'checks_0', True))
-                test_window.checks_0 = checks_0
-                result, checks_1 = ctx.checkbox("Checkbox 2", getattr(test_window, 'checks_1', False))
-                test_window.checks_1 = checks_1
-                result, checks_2 = ctx.checkbox("Checkbox 3", getattr(test_window, 'checks_2', True))
-                test_window.checks_2 = checks_2
+                result, test_window.checks_0 = ctx.checkbox("Checkbox 1", test_window.checks_0)
+                result, test_window.checks_1 = ctx.checkbox("Checkbox 2", test_window.checks_1)
+                result, test_window.checks_2 = ctx.checkbox("Checkbox 3", test_window.checks_2)
                 ctx.end_treenode()
 
             ctx.layout_end_column()
@@ -124,7 +137,7 @@ def test_window(ctx):
             ctx.layout_end_column()
 
         # Background Color section
-        if ctx.header("Background Color", pymui.Option.EXPANDED):
+        if ctx.header("Background Color", _OPT_EXPANDED):
             ctx.layout_row([-78, -1], 74)
 
             # Sliders column
@@ -133,15 +146,15 @@ def test_window(ctx):
 
             ctx.label("Red:")
             result, bg[0] = ctx.slider(bg[0], 0, 255)
-            if result & pymui.Result.CHANGE:
+            if result & _RES_CHANGE:
                 write_log(f"Red slider changed to {bg[0]}")
             ctx.label("Green:")
             result, bg[1] = ctx.slider(bg[1], 0, 255)
-            if result & pymui.Result.CHANGE:
+            if result & _RES_CHANGE:
                 write_log(f"Green slider changed to {bg[1]}")
             ctx.label("Blue:")
             result, bg[2] = ctx.slider(bg[2], 0, 255)
-            if result & pymui.Result.CHANGE:
+            if result & _RES_CHANGE:
                 write_log(f"Blue slider changed to {bg[2]}")
 
             ctx.layout_end_column()
@@ -156,6 +169,12 @@ def test_window(ctx):
         ctx.end_window()
 
 
+# Persistent checkbox state (equivalent to static variables in C)
+test_window.checks_0 = True
+test_window.checks_1 = False
+test_window.checks_2 = True
+
+
 def log_window(ctx):
     """Create the log window"""
     global logbuf_updated
@@ -166,7 +185,6 @@ def log_window(ctx):
         ctx.begin_panel("Log Output")
         panel = ctx.get_current_container()
         ctx.layout_row([-1], -1)
-        log_text = "\n".join(logbuf) if logbuf else ""
         ctx.text(log_text)
         ctx.end_panel()
 
@@ -177,13 +195,9 @@ def log_window(ctx):
         # Input textbox + submit button
         ctx.layout_row([-70, -1], 0)
 
-        # Initialize textbox if not exists
-        if not hasattr(log_window, 'textbox'):
-            log_window.textbox = pymui.Textbox(128)
-
         # Update textbox
         result, new_text = log_window.textbox.update(ctx)
-        submitted = bool(result & pymui.Result.SUBMIT)
+        submitted = bool(result & _RES_SUBMIT)
 
         if ctx.button("Submit"):
             submitted = True
@@ -196,6 +210,10 @@ def log_window(ctx):
         ctx.end_window()
 
 
+# Persistent textbox, created once at import
+log_window.textbox = pymui.Textbox(128)
+
+
 def process_frame(ctx):
     """Process one frame of UI"""
     ctx.begin()
@@ -223,6 +241,27 @@ key_map = {
     sdl2.SDLK_BACKSPACE: pymui.Key.BACKSPACE,
 }
 
+# Event-loop lookup helpers: SDL button ids are small (1..5), so index a
+# tuple directly; SDL keycodes are sparse, so keep the dict but bind .get once
+_BTN_LUT = tuple(button_map.get(i, 0) for i in range(6))
+_key_get = key_map.get
+_MOUSEBUTTON_EVENTS = frozenset((sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP))
+_KEY_EVENTS = frozenset((sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP))
+
+# Read event fields straight from the SDL_Event buffer with precompiled
+# structs (native byte order, like the event memory) instead of walking
+# the ctypes field descriptors on every access
+_unpack_i = struct.Struct("=i").unpack_from
+_unpack_xy = struct.Struct("=ii").unpack_from
+_unpack_button = struct.Struct("=B3xii").unpack_from  # button, x, y
+_MOTION_XY_OFFSET = sdl2.SDL_MouseMotionEvent.x.offset
+_WHEEL_Y_OFFSET = sdl2.SDL_MouseWheelEvent.y.offset
+_BUTTON_OFFSET = sdl2.SDL_MouseButtonEvent.button.offset
+_KEYSYM_OFFSET = sdl2.SDL_KeyboardEvent.keysym.offset + sdl2.SDL_Keysym.sym.offset
+
+# Byte offset of the text payload within SDL_Event (text is a union member at 0)
+_TEXTINPUT_OFFSET = sdl2.SDL_TextInputEvent.text.offset
+
 
 def main():
     """Main function"""
@@ -246,65 +285,68 @@ def main():
 
         # Main loop
         running = True
+        last_present = 0.0
+        # SDL_PollEvent overwrites the event in place, so allocate it once
+        event = sdl2.SDL_Event()
+        event_ref = ctypes.byref(event)
+        # The text payload always sits at the same address in the reused event
+        text_addr = ctypes.addressof(event) + _TEXTINPUT_OFFSET
         while running:
-            # Handle SDL events - use direct SDL_PollEvent like C version
-            event = sdl2.SDL_Event()
-            while sdl2.SDL_PollEvent(ctypes.byref(event)):
-                if event.type == sdl2.SDL_QUIT:
-                    running = False
-                elif event.type == sdl2.SDL_KEYDOWN and event.key.keysym.sym == sdl2.SDLK_ESCAPE:
+            # Handle SDL events - use direct SDL_PollEvent like C version;
+            # motion is coalesced to the last position, scroll is summed
+            last_mouse = None
+            scroll_accum = 0
+            while sdl2.SDL_PollEvent(event_ref):
+                etype = event.type
+                if etype == sdl2.SDL_QUIT:
                     running = False
-                elif event.type == sdl2.SDL_MOUSEMOTION:
-                    ctx.input_mousemove(event.motion.x, event.motion.y)
-                elif event.type == sdl2.SDL_MOUSEWHEEL:
-                    ctx.input_scroll(0, event.wheel.y * -30)
-                elif event.type == sdl2.SDL_TEXTINPUT:
-                    # Convert bytes to string properly
-                    text_bytes = event.text.text
-                    # Find null terminator
-                    null_pos = text_bytes.find(b'\x00')
-                    if null_pos >= 0:
-                        text_bytes = text_bytes[:null_pos]
-                    text = text_bytes.decode('utf-8', errors='replace')
+                elif etype == sdl2.SDL_MOUSEMOTION:
+                    last_mouse = _unpack_xy(event, _MOTION_XY_OFFSET)
+                elif etype == sdl2.SDL_MOUSEWHEEL:
+                    scroll_accum += _unpack_i(event, _WHEEL_Y_OFFSET)[0] * -30
+                elif etype == sdl2.SDL_TEXTINPUT:
+                    # string_at stops at the null terminator in C
+                    text = ctypes.string_at(text_addr).decode('utf-8', 'replace')
                     ctx.input_text(text)
-                elif event.type in (sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP):
-                    btn = button_map.get(event.button.button)
+                elif etype in _MOUSEBUTTON_EVENTS:
+                    b, x, y = _unpack_button(event, _BUTTON_OFFSET)
+                    btn = _BTN_LUT[b] if b < len(_BTN_LUT) else 0
                     if btn:
-                        if event.type == sdl2.SDL_MOUSEBUTTONDOWN:
-                            ctx.input_mousedown(event.button.x, event.button.y, btn)
+                        if etype == sdl2.SDL_MOUSEBUTTONDOWN:
+                            ctx.input_mousedown(x, y, btn)
                         else:
-                            ctx.input_mouseup(event.button.x, event.button.y, btn)
-                elif event.type in (sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP):
-                    key = key_map.get(event.key.keysym.sym)
+                            ctx.input_mouseup(x, y, btn)
+                        last_mouse = None  # button events also move the cursor
+                elif etype in _KEY_EVENTS:
+                    sym = _unpack_i(event, _KEYSYM_OFFSET)[0]
+                    if sym == sdl2.SDLK_ESCAPE and etype == sdl2.SDL_KEYDOWN:
+                        running = False
+                        continue
+                    key = _key_get(sym)
                     if key:
-                        if event.type == sdl2.SDL_KEYDOWN:
+                        if etype == sdl2.SDL_KEYDOWN:
                             ctx.input_keydown(key)
                         else:
                             ctx.input_keyup(key)
+            if last_mouse is not None:
+                ctx.input_mousemove(*last_mouse)
+            if scroll_accum:
+                ctx.input_scroll(0, scroll_accum)
 
             # Process frame
             process_frame(ctx)
 
-            # Render
-            pymui.renderer_clear(pymui.color(int(bg[0]), int(bg[1]), int(bg[2]), 255))
-
-            # Process commands
-            ctx.reset_command_iterator()
-            while True:
-                cmd = ctx.next_command()
-                if cmd is None:
-                    break
+            # Render only when the command list changed, refreshing once a
+            # second so the window stays responsive to the compositor
+            now = time.monotonic()
+            if ctx.commands_changed() or now - last_present > 1.0:
+                last_present = now
+                pymui.renderer_clear(pymui.color(int(bg[0]), int(bg[1]), int(bg[2]), 255))
 
-                if cmd.type == pymui.Command.TEXT:
-                    pymui.renderer_draw_text(cmd.text, cmd.pos, cmd.color)
-                elif cmd.type == pymui.Command.RECT:
-                    pymui.renderer_draw_rect(cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.ICON:
-                    pymui.renderer_draw_icon(cmd.icon_id, cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.CLIP:
-                    pymui.renderer_set_clip_rect(cmd.rect)
+                # Process commands in C
+                pymui.render_all_commands(ctx)
 
-            pymui.renderer_present()
+                pymui.renderer_present()
 
     finally:
         sdl2.SDL_Quit()
@@ -313,4 +355,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if DEBUG:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     sys.exit(main())
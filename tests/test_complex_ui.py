@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 
+import logging
+import os
+import struct
 import sys
+import time
 import ctypes
 import sdl2
 from pathlib import Path
@@ -14,6 +18,30 @@ except ImportError:
     from pymui import pymui
 
 
+# Per-event debug output is off by default; set PYMUI_DEBUG=1 to enable it
+DEBUG = os.environ.get("PYMUI_DEBUG") == "1"
+log = logging.getLogger(__name__)
+
+# pymui enum values used every frame, bound once
+_RES_CHANGE = pymui.Result.CHANGE
+_RES_SUBMIT = pymui.Result.SUBMIT
+_MOUSE_LEFT = pymui.Mouse.LEFT
+
+# Read event fields straight from the SDL_Event buffer with precompiled
+# structs (native byte order, like the event memory) instead of walking
+# the ctypes field descriptors on every access
+_unpack_i = struct.Struct("=i").unpack_from
+_unpack_xy = struct.Struct("=ii").unpack_from
+_unpack_button = struct.Struct("=B3xii").unpack_from  # button, x, y
+_MOTION_XY_OFFSET = sdl2.SDL_MouseMotionEvent.x.offset
+_WHEEL_Y_OFFSET = sdl2.SDL_MouseWheelEvent.y.offset
+_BUTTON_OFFSET = sdl2.SDL_MouseButtonEvent.button.offset
+_KEYSYM_OFFSET = sdl2.SDL_KeyboardEvent.keysym.offset + sdl2.SDL_Keysym.sym.offset
+
+# Byte offset of the text payload within SDL_Event (text is a union member at 0)
+_TEXTINPUT_OFFSET = sdl2.SDL_TextInputEvent.text.offset
+
+
 def main():
     """Test complex UI elements"""
     # Initialize SDL
@@ -30,40 +58,47 @@ def main():
         print("Press Escape to exit")
 
         running = True
+        last_present = 0.0
         click_count = 0
         slider_val = 50.0
         checkbox_state = False
         text_buf = ""
 
+        # SDL_PollEvent overwrites the event in place, so allocate it once
+        event = sdl2.SDL_Event()
+        event_ref = ctypes.byref(event)
+        # The text payload always sits at the same address in the reused event
+        text_addr = ctypes.addressof(event) + _TEXTINPUT_OFFSET
+
         while running:
-            # Handle SDL events
-            event = sdl2.SDL_Event()
-            while sdl2.SDL_PollEvent(ctypes.byref(event)):
-                if event.type == sdl2.SDL_QUIT:
+            # Handle SDL events; motion is coalesced to the last position
+            last_mouse = None
+            while sdl2.SDL_PollEvent(event_ref):
+                etype = event.type
+                if etype == sdl2.SDL_QUIT:
                     print("Quit event received")
                     running = False
-                elif event.type == sdl2.SDL_KEYDOWN and event.key.keysym.sym == sdl2.SDLK_ESCAPE:
+                elif etype == sdl2.SDL_KEYDOWN and _unpack_i(event, _KEYSYM_OFFSET)[0] == sdl2.SDLK_ESCAPE:
                     print("Escape pressed")
                     running = False
-                elif event.type == sdl2.SDL_MOUSEMOTION:
-                    ctx.input_mousemove(event.motion.x, event.motion.y)
-                elif event.type == sdl2.SDL_MOUSEBUTTONDOWN:
-                    btn = pymui.Mouse.LEFT if event.button.button == sdl2.SDL_BUTTON_LEFT else 0
-                    if btn:
-                        ctx.input_mousedown(event.button.x, event.button.y, btn)
-                elif event.type == sdl2.SDL_MOUSEBUTTONUP:
-                    btn = pymui.Mouse.LEFT if event.button.button == sdl2.SDL_BUTTON_LEFT else 0
-                    if btn:
-                        ctx.input_mouseup(event.button.x, event.button.y, btn)
-                elif event.type == sdl2.SDL_TEXTINPUT:
-                    # Convert bytes to string properly
-                    text_bytes = event.text.text
-                    # Find null terminator
-                    null_pos = text_bytes.find(b'\x00')
-                    if null_pos >= 0:
-                        text_bytes = text_bytes[:null_pos]
-                    text = text_bytes.decode('utf-8', errors='replace')
+                elif etype == sdl2.SDL_MOUSEMOTION:
+                    last_mouse = _unpack_xy(event, _MOTION_XY_OFFSET)
+                elif etype == sdl2.SDL_MOUSEBUTTONDOWN:
+                    b, x, y = _unpack_button(event, _BUTTON_OFFSET)
+                    if b == sdl2.SDL_BUTTON_LEFT:
+                        ctx.input_mousedown(x, y, _MOUSE_LEFT)
+                        last_mouse = None  # mousedown also moves the cursor
+                elif etype == sdl2.SDL_MOUSEBUTTONUP:
+                    b, x, y = _unpack_button(event, _BUTTON_OFFSET)
+                    if b == sdl2.SDL_BUTTON_LEFT:
+                        ctx.input_mouseup(x, y, _MOUSE_LEFT)
+                        last_mouse = None  # mouseup also moves the cursor
+                elif etype == sdl2.SDL_TEXTINPUT:
+                    # string_at stops at the null terminator in C
+                    text = ctypes.string_at(text_addr).decode('utf-8', 'replace')
                     ctx.input_text(text)
+            if last_mouse is not None:
+                ctx.input_mousemove(*last_mouse)
 
             # Process frame
             ctx.begin()
@@ -76,27 +111,31 @@ def main():
                 ctx.label("Button:")
                 if ctx.button("Click Me!"):
                     click_count += 1
-                    print(f"*** BUTTON CLICKED! Count: {click_count} ***")
+                    if DEBUG:
+                        log.debug("*** BUTTON CLICKED! Count: %d ***", click_count)
                 
                 # Slider test
                 ctx.label("Slider:")
                 result, new_val = ctx.slider(slider_val, 0.0, 100.0)
-                if result & pymui.Result.CHANGE:
-                    print(f"Slider changed from {slider_val} to {new_val}")
+                if result & _RES_CHANGE:
+                    if DEBUG:
+                        log.debug("Slider changed from %s to %s", slider_val, new_val)
                     slider_val = new_val
                 
                 # Checkbox test
                 ctx.label("Checkbox:")
                 result, new_state = ctx.checkbox("Test Check", checkbox_state)
-                if result & pymui.Result.CHANGE:
-                    print(f"Checkbox changed from {checkbox_state} to {new_state}")
+                if result & _RES_CHANGE:
+                    if DEBUG:
+                        log.debug("Checkbox changed from %s to %s", checkbox_state, new_state)
                     checkbox_state = new_state
                 
                 # Textbox test
                 ctx.label("Textbox:")
                 result, text_buf = ctx.textbox_ex(text_buf, 128)
-                if result & pymui.Result.SUBMIT:
-                    print(f"Text submitted: '{text_buf}'")
+                if result & _RES_SUBMIT:
+                    if DEBUG:
+                        log.debug("Text submitted: '%s'", text_buf)
                 
                 # Show current values
                 ctx.label(f"Button clicks: {click_count}")
@@ -108,26 +147,17 @@ def main():
 
             ctx.end()
 
-            # Render
-            pymui.renderer_clear(pymui.color(32, 32, 32, 255))
-
-            # Process commands
-            ctx.reset_command_iterator()
-            while True:
-                cmd = ctx.next_command()
-                if cmd is None:
-                    break
+            # Render only when the command list changed, refreshing once a
+            # second so the window stays responsive to the compositor
+            now = time.monotonic()
+            if ctx.commands_changed() or now - last_present > 1.0:
+                last_present = now
+                pymui.renderer_clear(pymui.color(32, 32, 32, 255))
 
-                if cmd.type == pymui.Command.TEXT:
-                    pymui.renderer_draw_text(cmd.text, cmd.pos, cmd.color)
-                elif cmd.type == pymui.Command.RECT:
-                    pymui.renderer_draw_rect(cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.ICON:
-                    pymui.renderer_draw_icon(cmd.icon_id, cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.CLIP:
-                    pymui.renderer_set_clip_rect(cmd.rect)
+                # Process commands in C
+                pymui.render_all_commands(ctx)
 
-            pymui.renderer_present()
+                pymui.renderer_present()
 
         print(f"Test completed. Button clicks: {click_count}")
 
@@ -144,4 +174,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if DEBUG:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     sys.exit(main())
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Tests for the pymui Context frame and command APIs.
+
+This module covers change detection, command iteration, reset/focus and the
+SDL input and frame helpers (input_sdl_event, render_all_commands, run_frame).
+"""
+
+import sys
+import ctypes
+from pathlib import Path
+
+# Add src to path for imports
+ROOTDIR = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(ROOTDIR))
+
+import pytest
+import pymui
+
+try:
+    import sdl2
+except ImportError:
+    sdl2 = None
+
+# Only the raw SDL event tests need pysdl2 to build events
+requires_sdl2 = pytest.mark.skipif(sdl2 is None, reason="pysdl2 is not installed")
+
+
+class TestCommandsChanged:
+    """Test frame-to-frame command change detection."""
+
+    @staticmethod
+    def _frame(ctx, text):
+        with ctx:
+            with ctx.window("Change Test", 10, 10, 200, 100) as window:
+                if window.is_open:
+                    ctx.label(text)
+
+    def test_changed_on_first_check(self):
+        """Test that a fresh context reports changes."""
+        assert pymui.Context().commands_changed() is True
+
+    def test_identical_frames_not_changed(self):
+        """Test that repeating the same UI reports no change."""
+        ctx = pymui.Context()
+        self._frame(ctx, "same")
+        assert ctx.commands_changed() is True
+        self._frame(ctx, "same")
+        assert ctx.commands_changed() is False
+
+    def test_different_frames_changed(self):
+        """Test that changing the UI reports a change."""
+        ctx = pymui.Context()
+        self._frame(ctx, "first")
+        ctx.commands_changed()
+        self._frame(ctx, "second")
+        assert ctx.commands_changed() is True
+
+    def test_end_does_not_track_changes(self):
+        """Test that only commands_changed() advances the stored hash."""
+        ctx = pymui.Context()
+        self._frame(ctx, "first")
+        ctx.commands_changed()
+        self._frame(ctx, "second")
+        self._frame(ctx, "first")
+        assert ctx.commands_changed() is False
+
+
+class TestTextCommandBytes:
+    """Test raw byte access on text commands."""
+
+    def test_text_bytes_matches_text(self):
+        """Test that text_bytes is the UTF-8 encoding of text."""
+        ctx = pymui.Context()
+        with ctx:
+            with ctx.window("Bytes Test", 10, 10, 200, 100) as window:
+                if window.is_open:
+                    ctx.label("héllo")
+        ctx.reset_command_iterator()
+        texts = [cmd for cmd in iter(ctx.next_command, None)
+                 if cmd.type == pymui.Command.TEXT]
+        assert texts
+        for cmd in texts:
+            assert cmd.text_bytes == cmd.text.encode("utf-8")
+        assert b"h\xc3\xa9llo" in [cmd.text_bytes for cmd in texts]
+
+
+class TestIterCommands:
+    """Test the decoded command iterator."""
+
+    def test_matches_next_command(self):
+        """Test that iter_commands yields the same stream as next_command."""
+        ctx = pymui.Context()
+        with ctx:
+            with ctx.window("Iter Test", 10, 10, 200, 100) as window:
+                if window.is_open:
+                    ctx.label("label")
+        ctx.reset_command_iterator()
+        expected = [cmd.type for cmd in iter(ctx.next_command, None)]
+        decoded = list(ctx.iter_commands())
+        assert [cmd_type for cmd_type, _ in decoded] == expected
+        assert (pymui.Command.TEXT, (b"label",)) in [
+            (cmd_type, args[:1]) for cmd_type, args in decoded
+            if cmd_type == pymui.Command.TEXT]
+
+    def test_bytes_labels_pass_through(self):
+        """Test that pre-encoded labels produce the same commands as str."""
+        def frame(label):
+            ctx = pymui.Context()
+            with ctx:
+                with ctx.window("Bytes", 0, 0, 200, 100) as window:
+                    if window.is_open:
+                        ctx.label(label)
+                        ctx.button(label)
+                        ctx.checkbox(label, False)
+            return [args[0] for cmd_type, args in ctx.iter_commands()
+                    if cmd_type == pymui.Command.TEXT]
+
+        texts = frame("caf\u00e9".encode())
+        assert texts == frame("caf\u00e9")
+        assert texts.count("caf\u00e9".encode()) == 3
+        with pytest.raises(TypeError):
+            pymui.Context().label(42)
+
+    @pytest.mark.parametrize("bad", [None, 42, bytearray(b"x")])
+    def test_draw_text_rejects_non_text(self, bad):
+        """Test that renderer_draw_text validates like the widget calls."""
+        with pytest.raises(TypeError):
+            pymui.renderer_draw_text(bad, pymui.Vec2(0, 0), pymui.Color(0, 0, 0))
+
+    def test_args_follow_renderer_order(self):
+        """Test that rect arguments are (rect, color)."""
+        ctx = pymui.Context()
+        with ctx:
+            with ctx.window("Iter Test", 10, 10, 200, 100):
+                pass
+        cmd_type, args = next(iter(ctx.iter_commands()))
+        assert cmd_type == pymui.Command.RECT
+        rect, color = args
+        assert (rect.x, rect.y, rect.w, rect.h) == (10, 10, 200, 100)
+        assert isinstance(color, pymui.Color)
+
+    def test_render_all_commands_count(self, renderer):
+        """Test that render_all_commands reports as many commands as it walks."""
+        ctx = pymui.Context()
+        with ctx:
+            with ctx.window("Iter Test", 10, 10, 200, 100) as window:
+                if window.is_open:
+                    ctx.label("label")
+        expected = sum(1 for _ in ctx.iter_commands())
+        pymui.renderer_clear(pymui.color(0, 0, 0, 255))
+        assert pymui.render_all_commands(ctx) == expected > 0
+
+
+class TestReset:
+    """Test reusing a context through reset()."""
+
+    def test_reset_clears_state(self):
+        """Test that reset() discards windows and restarts change tracking."""
+        ctx = pymui.Context()
+        with ctx:
+            with ctx.window("Before", 0, 0, 100, 100):
+                pass
+        assert ctx.commands_changed()
+        with ctx:
+            with ctx.window("Before", 0, 0, 100, 100):
+                pass
+        assert not ctx.commands_changed()
+
+        ctx.reset()
+        assert ctx.commands_changed()
+        with ctx:
+            with ctx.window("After", 0, 0, 100, 100) as window:
+                assert window.is_open
+
+
+class TestFocus:
+    """Test reading back the focused widget."""
+
+    def test_get_focus_follows_set_focus(self):
+        """Test that get_focus() reports the ID passed to set_focus()."""
+        ctx = pymui.Context()
+        assert ctx.get_focus() == 0
+        widget_id = ctx.get_id("field")
+        ctx.set_focus(widget_id)
+        assert ctx.get_focus() == widget_id
+
+    def test_get_last_id_names_the_last_widget(self):
+        """Test that get_last_id() matches the ID a widget used for focus."""
+        ctx = pymui.Context()
+        with ctx:
+            with ctx.window("Focus", 0, 0, 200, 100) as window:
+                if window.is_open:
+                    ctx.button("Press")
+                    button_id = ctx.get_last_id()
+                    # Same ID stack as the button, so the same hash
+                    assert button_id == ctx.get_id("Press") != 0
+
+
+@requires_sdl2
+class TestInputSdlEvent:
+    """Test forwarding raw SDL events through input_sdl_event."""
+
+    @staticmethod
+    def _frame(ctx):
+        with ctx:
+            with ctx.window("Input Test", 0, 0, 200, 200) as window:
+                if window.is_open:
+                    return ctx.button("Click")
+        return 0
+
+    def test_click_reaches_button(self):
+        """Test that SDL motion and button events drive a microui click."""
+        ctx = pymui.Context()
+        event = sdl2.SDL_Event()
+        addr = ctypes.addressof(event)
+        self._frame(ctx)
+
+        event.type = sdl2.SDL_MOUSEMOTION
+        event.motion.x, event.motion.y = 60, 40
+        assert ctx.input_sdl_event(addr) == sdl2.SDL_MOUSEMOTION
+        assert self._frame(ctx) == 0
+
+        event.type = sdl2.SDL_MOUSEBUTTONDOWN
+        event.button.button = sdl2.SDL_BUTTON_LEFT
+        event.button.x, event.button.y = 60, 40
+        ctx.input_sdl_event(addr)
+        assert self._frame(ctx) & pymui.Result.SUBMIT
+
+    def test_unhandled_type_is_returned(self):
+        """Test that events microui ignores still report their type."""
+        ctx = pymui.Context()
+        event = sdl2.SDL_Event()
+        event.type = sdl2.SDL_QUIT
+        assert ctx.input_sdl_event(ctypes.addressof(event)) == sdl2.SDL_QUIT
+
+    def test_null_address_rejected(self):
+        """Test that a NULL event address raises instead of crashing."""
+        with pytest.raises(ValueError):
+            pymui.Context().input_sdl_event(0)
+
+
+
+@requires_sdl2
+class TestRunFrame:
+    """Test the single-call SDL frame driver."""
+
+    @staticmethod
+    def _ui(ctx):
+        if ctx.begin_window("Frame", pymui.rect(0, 0, 200, 100)):
+            ctx.label("hello")
+            ctx.end_window()
+
+    def test_runs_ui_between_begin_and_end(self, renderer):
+        """Test that on_ui builds the frame and the loop keeps running."""
+        ctx = pymui.Context()
+        calls = []
+        bg = pymui.color(0, 0, 0, 255)
+        assert pymui.run_frame(ctx, lambda c: calls.append(self._ui(c)), bg)
+        assert len(calls) == 1
+        # run_frame() already compared this frame with the last one
+        assert not ctx.commands_changed()
+        assert sum(1 for _ in ctx.iter_commands()) > 0
+
+    def test_ui_error_still_ends_frame(self, renderer):
+        """Test that an exception from on_ui propagates after end()."""
+        ctx = pymui.Context()
+
+        def broken_ui(c):
+            with c.window("Broken", 0, 0, 100, 100):
+                raise ValueError("ui failed")
+
+        with pytest.raises(ValueError):
+            pymui.run_frame(ctx, broken_ui, pymui.color(0, 0, 0, 255))
+        # The context is between frames again and can start a new one
+        assert pymui.run_frame(ctx, self._ui, pymui.color(0, 0, 0, 255), idle_wait_ms=0)
+
+    def test_quit_event_stops(self, renderer):
+        """Test that a queued SDL_QUIT makes run_frame return False."""
+        ctx = pymui.Context()
+        event = sdl2.SDL_Event()
+        event.type = sdl2.SDL_QUIT
+        sdl2.SDL_PushEvent(ctypes.byref(event))
+        assert not pymui.run_frame(ctx, self._ui, pymui.color(0, 0, 0, 255))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import logging
+import os
 import sys
 import sdl2
 import sdl2.ext
@@ -15,6 +17,11 @@ except ImportError:
     from pymui import pymui
 
 
+# Per-event debug output is off by default; set PYMUI_DEBUG=1 to enable it
+DEBUG = os.environ.get("PYMUI_DEBUG") == "1"
+log = logging.getLogger(__name__)
+
+
 def test_events_directly():
     """Test SDL event handling directly"""
     # Initialize SDL
@@ -30,24 +37,27 @@ def test_events_directly():
 
     # Test both event handling methods
     frame_count = 0
+    # SDL_PollEvent overwrites the event in place, so allocate it once
+    event = sdl2.SDL_Event()
+    event_ref = ctypes.byref(event)
     while frame_count < 60:  # Run for ~1 second
         frame_count += 1
 
-        print(f"\n--- Frame {frame_count} ---")
+        if DEBUG:
+            log.debug("\n--- Frame %d ---", frame_count)
 
         # Method 1: Using SDL_PollEvent directly (similar to C code)
-        event = sdl2.SDL_Event()
         direct_events = []
-        while sdl2.SDL_PollEvent(ctypes.byref(event)):
+        while sdl2.SDL_PollEvent(event_ref):
             direct_events.append(event.type)
 
-        if direct_events:
-            print(f"Direct SDL_PollEvent got {len(direct_events)} events: {direct_events}")
+        if DEBUG and direct_events:
+            log.debug("Direct SDL_PollEvent got %d events: %s", len(direct_events), direct_events)
 
         # Method 2: Using sdl2.ext.get_events()
         ext_events = sdl2.ext.get_events()
-        if ext_events:
-            print(f"sdl2.ext.get_events got {len(ext_events)} events: {[e.type for e in ext_events]}")
+        if DEBUG and ext_events:
+            log.debug("sdl2.ext.get_events got %d events: %s", len(ext_events), [e.type for e in ext_events])
 
         # Clear screen and present to keep window responsive
         pymui.renderer_clear(pymui.color(32, 32, 32, 255))
@@ -58,4 +68,6 @@ def test_events_directly():
 
 
 if __name__ == "__main__":
+    if DEBUG:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     test_events_directly()
\ No newline at end of file
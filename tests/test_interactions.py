@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
+import functools
 import sys
-import ctypes
 import sdl2
 from pathlib import Path
 
@@ -13,37 +13,25 @@ except ImportError:
     sys.path.insert(0, str(ROOTDIR))
     from pymui import pymui
 
+from _sdl_harness import run_loop
 
-# SDL button mapping
-button_map = {
-    sdl2.SDL_BUTTON_LEFT: pymui.Mouse.LEFT,
-    sdl2.SDL_BUTTON_RIGHT: pymui.Mouse.RIGHT,
-    sdl2.SDL_BUTTON_MIDDLE: pymui.Mouse.MIDDLE,
-}
-
-# SDL key mapping
-key_map = {
-    sdl2.SDLK_LSHIFT: pymui.Key.SHIFT,
-    sdl2.SDLK_RSHIFT: pymui.Key.SHIFT,
-    sdl2.SDLK_LCTRL: pymui.Key.CTRL,
-    sdl2.SDLK_RCTRL: pymui.Key.CTRL,
-    sdl2.SDLK_LALT: pymui.Key.ALT,
-    sdl2.SDLK_RALT: pymui.Key.ALT,
-    sdl2.SDLK_RETURN: pymui.Key.RETURN,
-    sdl2.SDLK_BACKSPACE: pymui.Key.BACKSPACE,
-    sdl2.SDLK_ESCAPE: pymui.Key.BACKSPACE,  # Use backspace for escape for now
-}
 
 # Test variables
 slider_value = 50.0
 checkbox_state = False
 
-def test_window(ctx):
-    """Simple test window with interactive elements"""
-    global slider_value, checkbox_state
+# Value labels are rebuilt only when the value changes
+_CHECKBOX_LABELS = ("Checkbox: ✗", "Checkbox: ✓")
 
-    # Properly initialize frame
-    ctx.begin()
+
+@functools.lru_cache(maxsize=1)
+def _slider_label(value):
+    return f"Slider: {value:.2f}"
+
+
+def ui_window(ctx):
+    """Simple test window with interactive elements (run between begin/end)"""
+    global slider_value, checkbox_state
 
     if ctx.begin_window("Interaction Test", pymui.rect(50, 50, 350, 250)):
         ctx.layout_row([120, -1], 0)
@@ -69,8 +57,8 @@ def test_window(ctx):
 
         # Display current values
         ctx.label("Current values:")
-        ctx.label(f"Slider: {slider_value:.2f}")
-        ctx.label(f"Checkbox: {'✓' if checkbox_state else '✗'}")
+        ctx.label(_slider_label(slider_value))
+        ctx.label(_CHECKBOX_LABELS[checkbox_state])
 
         # Instructions
         ctx.label("Instructions:")
@@ -78,102 +66,28 @@ def test_window(ctx):
 
         ctx.end_window()
 
-    # Properly end frame
+
+def test_window(ctx):
+    """Build the test window in a standalone frame"""
+    ctx.begin()
+    ui_window(ctx)
     ctx.end()
 
 
+def log_mouse_down(event):
+    """Echo mouse presses before the harness forwards them"""
+    if event.type == sdl2.SDL_MOUSEBUTTONDOWN:
+        print(f"Mouse down at ({event.button.x}, {event.button.y})")
+
+
 def main():
     """Main function"""
-    # Initialize SDL
-    if sdl2.SDL_Init(sdl2.SDL_INIT_EVERYTHING) != 0:
-        print(f"SDL_Init Error: {sdl2.SDL_GetError()}")
-        return 1
-
-    try:
-        print("Initializing renderer...")
-        pymui.renderer_init()
-        print("Creating context...")
-        ctx = pymui.Context()
-        print("Starting main loop - try interacting with the UI elements!")
-
-        running = True
-        while running:
-            # Handle SDL events using direct polling (like C version)
-            event = sdl2.SDL_Event()
-            while sdl2.SDL_PollEvent(ctypes.byref(event)):
-                if event.type == sdl2.SDL_QUIT:
-                    print("Quit event received")
-                    running = False
-                elif event.type == sdl2.SDL_KEYDOWN and event.key.keysym.sym == sdl2.SDLK_ESCAPE:
-                    print("Escape key pressed")
-                    running = False
-                elif event.type == sdl2.SDL_MOUSEMOTION:
-                    ctx.input_mousemove(event.motion.x, event.motion.y)
-                elif event.type == sdl2.SDL_MOUSEWHEEL:
-                    ctx.input_scroll(0, event.wheel.y * -30)
-                elif event.type == sdl2.SDL_TEXTINPUT:
-                    # Handle text input properly
-                    text_bytes = event.text.text
-                    null_pos = text_bytes.find(b'\x00')
-                    if null_pos >= 0:
-                        text_bytes = text_bytes[:null_pos]
-                    text = text_bytes.decode('utf-8', errors='replace')
-                    ctx.input_text(text)
-                elif event.type in (sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP):
-                    btn = button_map.get(event.button.button)
-                    if btn:
-                        if event.type == sdl2.SDL_MOUSEBUTTONDOWN:
-                            print(f"Mouse down at ({event.button.x}, {event.button.y})")
-                            ctx.input_mousedown(event.button.x, event.button.y, btn)
-                        else:
-                            ctx.input_mouseup(event.button.x, event.button.y, btn)
-                elif event.type in (sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP):
-                    key = key_map.get(event.key.keysym.sym)
-                    if key:
-                        if event.type == sdl2.SDL_KEYDOWN:
-                            ctx.input_keydown(key)
-                        else:
-                            ctx.input_keyup(key)
-
-            # Process frame
-            ctx.begin()
-            test_window(ctx)
-            ctx.end()
-
-            # Render
-            pymui.renderer_clear(pymui.color(64, 64, 64, 255))
-
-            # Process commands
-            ctx.reset_command_iterator()
-            while True:
-                cmd = ctx.next_command()
-                if cmd is None:
-                    break
-
-                if cmd.type == pymui.Command.TEXT:
-                    pymui.renderer_draw_text(cmd.text.encode('utf-8'), cmd.pos, cmd.color)
-                elif cmd.type == pymui.Command.RECT:
-                    pymui.renderer_draw_rect(cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.ICON:
-                    pymui.renderer_draw_icon(cmd.icon_id, cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.CLIP:
-                    pymui.renderer_set_clip_rect(cmd.rect)
-
-            pymui.renderer_present()
-
+    print("Starting main loop - try interacting with the UI elements!")
+    result = run_loop(ui_window, on_event=log_mouse_down)
+    if result == 0:
         print("Test completed successfully!")
-
-    except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-    finally:
-        sdl2.SDL_Quit()
-
-    return 0
+    return result
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -8,6 +8,7 @@ buffer overflows, or other memory-related issues.
 
 import sys
 import gc
+from array import array
 import tracemalloc
 from pathlib import Path
 
@@ -22,30 +23,28 @@ import pymui
 class TestMemorySafety:
     """Test memory safety and leak detection."""
 
-    def setup_method(self):
-        """Set up memory tracking for each test."""
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def memory_baseline(cls):
+        """Track memory across the whole class and check for leaks at the end."""
         gc.collect()
         tracemalloc.start()
-        self.baseline = tracemalloc.take_snapshot()
+        baseline = tracemalloc.take_snapshot()
+        yield baseline
 
-    def teardown_method(self):
-        """Check for memory leaks after each test."""
         gc.collect()
         current = tracemalloc.take_snapshot()
-        top_stats = current.compare_to(self.baseline, 'lineno')
-
-        # Check for significant memory growth
-        pymui_growth = 0
-        for stat in top_stats[:10]:
-            if 'pymui' in str(stat.traceback):
-                pymui_growth += stat.size_diff
+        # Filter to pymui frames inside tracemalloc rather than per-stat in Python
+        filters = [tracemalloc.Filter(True, "*pymui*")]
+        top_stats = current.filter_traces(filters).compare_to(
+            baseline.filter_traces(filters), 'lineno')
+        tracemalloc.stop()
 
         # Allow some growth but flag excessive amounts (1MB threshold)
+        pymui_growth = sum(stat.size_diff for stat in top_stats)
         if pymui_growth > 1024 * 1024:
             pytest.fail(f"Excessive memory growth detected: {pymui_growth / 1024 / 1024:.2f} MB")
 
-        tracemalloc.stop()
-
     def test_context_creation_cleanup(self):
         """Test Context creation and cleanup doesn't leak memory."""
         contexts = []
@@ -61,13 +60,13 @@ class TestMemorySafety:
 
     def test_object_lifecycle_safety(self):
         """Test that object lifecycle is memory-safe."""
-        objects = []
-
-        for i in range(1000):
-            vec = pymui.Vec2(i, i + 1)
-            rect = pymui.Rect(i, i + 1, i + 2, i + 3)
-            color = pymui.Color(i % 256, (i + 1) % 256, (i + 2) % 256, (i + 3) % 256)
-            objects.extend([vec, rect, color])
+        # Build each type in one comprehension rather than a per-iteration extend
+        n = 1000
+        objects = [pymui.Vec2(i, i + 1) for i in range(n)]
+        objects += [pymui.Rect(i, i + 1, i + 2, i + 3) for i in range(n)]
+        objects += [pymui.Color(i % 256, (i + 1) % 256, (i + 2) % 256, (i + 3) % 256)
+                    for i in range(n)]
+        assert len(objects) == 3 * n
 
         # Clean up
         del objects
@@ -115,11 +114,21 @@ class TestMemorySafety:
         # NOTE: Avoiding ctx.text() which triggers microui assertion failures
         # Focus only on Textbox operations which don't require UI context
 
+        # One long-lived textbox, as in real use; rotate payloads through it
+        tb = pymui.Textbox(128)
         for i in range(500):
-            # Textbox operations (safe - no UI context needed)
-            tb = pymui.Textbox(128)
             test_string = f"Test string {i}"
             tb.text = test_string
+            assert tb.text == test_string
+        del tb
+
+        gc.collect()
+
+    def test_repeated_textbox_alloc_free(self):
+        """Test textbox allocation and deallocation for memory leaks."""
+        for i in range(20):
+            tb = pymui.Textbox(128)
+            tb.text = f"Test string {i}"
             _ = tb.text
             del tb
 
@@ -129,6 +138,8 @@ class TestMemorySafety:
         """Test large buffer handling is safe."""
         # Test various buffer sizes
         sizes = [8, 16, 64, 256, 1024, 4096]  # Start with 8 to ensure "small" fits
+        # One oversized payload, sliced per size, instead of a new string each time
+        big_text = "A" * (max(sizes) * 2)
 
         for size in sizes:
             tb = pymui.Textbox(size)
@@ -142,8 +153,7 @@ class TestMemorySafety:
                 assert tb.text == "x"
 
             # Test with text larger than buffer
-            large_text = "A" * (size * 2)
-            tb.text = large_text
+            tb.text = big_text[:size * 2]
             result = tb.text
 
             # Should be truncated but not crash
@@ -181,7 +191,9 @@ class TestMemorySafety:
         """Stress test context begin/end cycles."""
         ctx = pymui.Context()
 
-        for i in range(1000):
+        # Bulk cycles run in C; a few Python-level cycles keep that path covered
+        ctx.stress_cycles(1000)
+        for i in range(5):
             ctx.begin()
 
             # No UI operations - just test begin/end cycle
@@ -189,6 +201,9 @@ class TestMemorySafety:
 
             ctx.end()
 
+        with pytest.raises(ValueError):
+            ctx.stress_cycles(-1)
+
         del ctx
 
     def test_multiple_contexts_safety(self):
@@ -299,9 +314,9 @@ class TestBufferOverflowProtection:
         """Test repeated buffer overflow attempts don't accumulate."""
         tb = pymui.Textbox(32)
 
-        # Repeatedly try to overflow
-        for i in range(100):
-            overflow_text = "X" * (i + 100)  # Always larger than buffer
+        # Repeatedly try to overflow, with payloads built before the loop
+        payloads = ["X" * (i + 100) for i in range(100)]  # Always larger than buffer
+        for overflow_text in payloads:
             tb.text = overflow_text
             result = tb.text
 
@@ -311,6 +326,42 @@ class TestBufferOverflowProtection:
 
         del tb
 
+    def test_layout_row_int_buffer(self, ctx):
+        """Test layout_row reads int buffers in place and rejects other dtypes."""
+        ctx.begin()
+        ctx.begin_window("Rows", pymui.Rect(0, 0, 300, 300))
+
+        ctx.layout_row([150, -1], 0)
+        from_list = (ctx.layout_next(), ctx.layout_next())
+        ctx.layout_row(array('i', (150, -1)), 0)
+        from_buffer = (ctx.layout_next(), ctx.layout_next())
+        assert [(r.w, r.h) for r in from_buffer] == [(r.w, r.h) for r in from_list]
+
+        with pytest.raises(ValueError):
+            ctx.layout_row(array('d', (150.0, -1.0)), 0)
+        ctx.layout_row(array('i'), 0)
+
+        ctx.end_window()
+        ctx.end()
+
+    def test_slider_row_edits_buffer_in_place(self, ctx):
+        """Test slider_row writes through a float buffer and rejects others."""
+        values = array('f', (10.0, 20.0, 30.0, 40.0))
+        ctx.begin()
+        ctx.begin_window("Sliders", pymui.Rect(0, 0, 300, 300))
+
+        assert ctx.slider_row(values, 0, 255, 40) == 0
+        assert list(values) == [10.0, 20.0, 30.0, 40.0]
+        ctx.slider_row(array('f'), 0, 255, 40)
+
+        with pytest.raises(ValueError):
+            ctx.slider_row(array('d', (1.0,)), 0, 255, 40)
+        with pytest.raises(BufferError):
+            ctx.slider_row(bytes(16), 0, 255, 40)
+
+        ctx.end_window()
+        ctx.end()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -1,29 +1,36 @@
 #!/usr/bin/env python3
 
 import sys
+from pathlib import Path
+
+import pytest
+
+ROOTDIR = Path(__file__).parent.parent / "src"
 
 try:
     from pymui import pymui
-    print("pymui imported successfully")
+except ImportError:
+    sys.path.insert(0, str(ROOTDIR))
+    from pymui import pymui
 
-    # Test basic objects
-    ctx = pymui.Context()
-    print("Context created successfully")
+
+def test_basic_objects():
+    """Test that the basic value types construct"""
+    assert pymui.Context() is not None
 
     rect = pymui.rect(10, 10, 100, 100)
-    print(f"Rect created: {rect}")
+    assert (rect.x, rect.y, rect.w, rect.h) == (10, 10, 100, 100)
 
     color = pymui.color(255, 0, 0)
-    print(f"Color created: {color}")
+    assert (color.r, color.g, color.b, color.a) == (255, 0, 0, 255)
+
 
-    # Test renderer init
-    pymui.renderer_init()
-    print("Renderer initialized successfully")
+def test_renderer_init(renderer):
+    """Test that the shared renderer is usable with a fresh context"""
+    ctx = pymui.Context()
+    assert ctx is not None
+    assert pymui.renderer_get_text_height() > 0
 
-    print("All basic tests passed!")
 
-except Exception as e:
-    print(f"Error: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
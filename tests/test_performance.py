@@ -6,9 +6,17 @@ This module provides benchmarks to ensure performance doesn't regress
 as new features are added or code is refactored.
 """
 
-import time
-import statistics
+import gc
+import io
+import math
+import operator
+import os
 import sys
+import time
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from itertools import repeat, starmap
 from pathlib import Path
 
 # Add src to path for imports
@@ -21,37 +29,137 @@ except ImportError:
     import pymui
 
 
-def benchmark(func, iterations=1000, warmup=10):
+@contextmanager
+def gc_disabled():
+    """Keep cyclic GC from running inside a measurement window."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+@contextmanager
+def pinned_cpu():
+    """Pin the process to one CPU and lengthen the thread switch interval.
+
+    Scheduler migrations between cores (or P/E-core types) shift samples
+    far more than the code under test does. The CPU comes from
+    PYMUI_BENCH_CPU, defaulting to the highest one currently allowed, since
+    CPU 0 usually services most interrupts. Pinning is skipped where
+    sched_setaffinity is unavailable. For stable clocks also set the
+    frequency governor, e.g. ``cpupower frequency-set -g performance``.
+    """
+    old_interval = sys.getswitchinterval()
+    old_affinity = None
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            old_affinity = os.sched_getaffinity(0)
+            cpu = int(os.environ.get("PYMUI_BENCH_CPU", max(old_affinity)))
+            os.sched_setaffinity(0, {cpu})
+        except (OSError, ValueError):
+            old_affinity = None
+    sys.setswitchinterval(1.0)
+    try:
+        yield
+    finally:
+        sys.setswitchinterval(old_interval)
+        if old_affinity is not None:
+            os.sched_setaffinity(0, old_affinity)
+
+
+def _call_n(func, n, _consume=deque(maxlen=0).extend):
+    """Call func() n times with the loop itself running in C.
+
+    starmap over empty argument tuples makes the calls and a zero-length
+    deque drains the iterator, so no bytecode runs between calls.
+    """
+    _consume(starmap(func, repeat((), n)))
+
+
+def _autorange(func, target_ns=1_000_000, max_inner=1 << 16):
+    """Find a batch size whose run takes at least target_ns.
+
+    Doubles from 1 like timeit.Timer.autorange, so fast callables are timed
+    well above the clock resolution.
+    """
+    inner = 1
+    while inner < max_inner:
+        start = time.perf_counter_ns()
+        _call_n(func, inner)
+        if time.perf_counter_ns() - start >= target_ns:
+            break
+        inner *= 2
+    return inner
+
+
+def _summarize(samples, inner):
+    """Per-call statistics in seconds from batch timings in nanoseconds.
+
+    Sums run over the integer samples with builtins (sum/map/operator.mul),
+    so the reduction stays in C and is exact until the final division. The
+    sum-of-squares variance is therefore free of cancellation error, which
+    a Welford-style running update would only approximate in floats.
+    """
+    n = len(samples)
+    scale = 1e-9 / inner
+    ordered = sorted(samples)
+    total = sum(ordered)
+    mid = n // 2
+    median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    if n > 1:
+        sum_sq = sum(map(operator.mul, ordered, ordered))
+        stdev = math.sqrt((n * sum_sq - total * total) / (n * (n - 1)))
+    else:
+        stdev = 0
+    return {
+        'mean': total / n * scale,
+        'median': median * scale,
+        'stdev': stdev * scale,
+        'min': ordered[0] * scale,
+        'max': ordered[-1] * scale,
+    }
+
+
+def benchmark(func, iterations=1000, warmup=10, inner=None):
     """Benchmark a function with multiple iterations.
 
+    Each sample times a batch of ``inner`` calls with perf_counter_ns and is
+    reported per call, so sub-microsecond operations are not swamped by
+    timer overhead and resolution.
+
     Args:
         func: Function to benchmark
-        iterations: Number of timing iterations
+        iterations: Number of timing samples
         warmup: Number of warmup iterations
+        inner: Calls per sample, or None to pick one automatically
 
     Returns:
-        dict: Benchmark results with timing statistics
+        dict: Benchmark results with per-call timing statistics in seconds
     """
     # Warmup iterations
-    for _ in range(warmup):
+    for _ in repeat(None, warmup):
         func()
 
-    # Actual timing
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        func()
-        end = time.perf_counter()
-        times.append(end - start)
+    if inner is None:
+        inner = _autorange(func)
 
-    return {
-        'mean': statistics.mean(times),
-        'median': statistics.median(times),
-        'stdev': statistics.stdev(times) if len(times) > 1 else 0,
-        'min': min(times),
-        'max': max(times),
-        'iterations': iterations
-    }
+    # Actual timing into a zero-filled buffer of raw int64s, sized up front
+    # so nothing is reallocated inside the measurement
+    samples = array('q', bytes(8 * iterations))
+    perf_counter_ns = time.perf_counter_ns
+    call_n = _call_n
+    for i in range(iterations):
+        start = perf_counter_ns()
+        call_n(func, inner)
+        samples[i] = perf_counter_ns() - start
+
+    result = _summarize(samples, inner)
+    result['iterations'] = iterations
+    result['inner'] = inner
+    return result
 
 
 class PerformanceBenchmarks:
@@ -61,20 +169,38 @@ class PerformanceBenchmarks:
         self.ctx = pymui.Context()
         self.results = {}
 
+    # Each closure binds the callables it uses as default arguments, so the
+    # timed body resolves them with LOAD_FAST instead of attribute lookups.
+
     def benchmark_context_creation(self):
-        """Benchmark Context creation and destruction."""
-        def create_destroy():
-            ctx = pymui.Context()
-            del ctx
+        """Benchmark Context creation; contexts are freed after timing."""
+        pool = []
 
-        return benchmark(create_destroy, iterations=100)
+        def construct(append=pool.append, Context=pymui.Context):
+            append(Context())
+
+        try:
+            return benchmark(construct, iterations=100, warmup=10, inner=1)
+        finally:
+            pool.clear()
+
+    def benchmark_context_destruction(self):
+        """Benchmark Context destruction from a pool built before timing."""
+        iterations, warmup = 100, 10
+        pool = [pymui.Context() for _ in range(iterations + warmup)]
+
+        # The popped context is dropped by _call_n, freeing it in the call
+        def destruct(pop=pool.pop):
+            return pop()
+
+        return benchmark(destruct, iterations=iterations, warmup=warmup, inner=1)
 
     def benchmark_basic_objects(self):
         """Benchmark creation of basic objects (Vec2, Rect, Color)."""
-        def create_objects():
-            v = pymui.Vec2(10, 20)
-            r = pymui.Rect(0, 0, 100, 50)
-            c = pymui.Color(255, 128, 64, 255)
+        def create_objects(Vec2=pymui.Vec2, Rect=pymui.Rect, Color=pymui.Color):
+            v = Vec2(10, 20)
+            r = Rect(0, 0, 100, 50)
+            c = Color(255, 128, 64, 255)
             # Access properties to ensure they're not optimized away
             _ = v.x + r.w + c.r
 
@@ -82,50 +208,66 @@ class PerformanceBenchmarks:
 
     def benchmark_frame_cycle(self):
         """Benchmark complete frame begin/end cycle."""
-        def frame_cycle():
-            self.ctx.begin()
-            self.ctx.end()
+        def frame_cycle(begin=self.ctx.begin, end=self.ctx.end):
+            begin()
+            end()
 
         return benchmark(frame_cycle)
 
     def benchmark_simple_window(self):
         """Benchmark simple window creation."""
-        def simple_window():
-            self.ctx.begin()
-            if self.ctx.begin_window("Benchmark", pymui.rect(10, 10, 200, 100)):
-                self.ctx.end_window()
-            self.ctx.end()
+        ctx = self.ctx
+
+        def simple_window(begin=ctx.begin, end=ctx.end, begin_window=ctx.begin_window,
+                          end_window=ctx.end_window, win_rect=pymui.rect(10, 10, 200, 100)):
+            begin()
+            if begin_window("Benchmark", win_rect):
+                end_window()
+            end()
 
         return benchmark(simple_window, iterations=500)
 
     def benchmark_widget_creation(self):
         """Benchmark widget creation performance."""
-        def create_widgets():
-            self.ctx.begin()
-            if self.ctx.begin_window("Widgets", pymui.rect(10, 10, 300, 200)):
-                self.ctx.label("Test Label")
-                self.ctx.button("Test Button")
-                result, state = self.ctx.checkbox("Test Checkbox", False)
-                result, value = self.ctx.slider(50.0, 0.0, 100.0)
-                self.ctx.text("Some text content")
-                self.ctx.end_window()
-            self.ctx.end()
+        ctx = self.ctx
+
+        def create_widgets(begin=ctx.begin, end=ctx.end, begin_window=ctx.begin_window,
+                           end_window=ctx.end_window, label=ctx.label, button=ctx.button,
+                           checkbox=ctx.checkbox, slider=ctx.slider, text=ctx.text,
+                           win_rect=pymui.rect(10, 10, 300, 200)):
+            begin()
+            if begin_window("Widgets", win_rect):
+                label("Test Label")
+                button("Test Button")
+                result, state = checkbox("Test Checkbox", False)
+                result, value = slider(50.0, 0.0, 100.0)
+                text("Some text content")
+                end_window()
+            end()
 
         return benchmark(create_widgets, iterations=200)
 
     def benchmark_layout_operations(self):
         """Benchmark layout operations."""
-        def layout_ops():
-            self.ctx.begin()
-            if self.ctx.begin_window("Layout", pymui.rect(10, 10, 400, 300)):
-                self.ctx.layout_row([100, 150, -1], 25)
-                self.ctx.layout_begin_column()
-                self.ctx.layout_width(200)
-                self.ctx.layout_height(30)
-                rect = self.ctx.layout_next()
-                self.ctx.layout_end_column()
-                self.ctx.end_window()
-            self.ctx.end()
+        ctx = self.ctx
+        row_widths = (100, 150, -1)
+
+        def layout_ops(begin=ctx.begin, end=ctx.end, begin_window=ctx.begin_window,
+                       end_window=ctx.end_window, layout_row=ctx.layout_row,
+                       layout_begin_column=ctx.layout_begin_column,
+                       layout_end_column=ctx.layout_end_column,
+                       layout_width=ctx.layout_width, layout_height=ctx.layout_height,
+                       layout_next=ctx.layout_next, win_rect=pymui.rect(10, 10, 400, 300)):
+            begin()
+            if begin_window("Layout", win_rect):
+                layout_row(row_widths, 25)
+                layout_begin_column()
+                layout_width(200)
+                layout_height(30)
+                next_rect = layout_next()
+                layout_end_column()
+                end_window()
+            end()
 
         return benchmark(layout_ops, iterations=300)
 
@@ -138,57 +280,70 @@ class PerformanceBenchmarks:
             "Long text: " + "A" * 100,
             "Special chars: !@#$%^&*()[]{}|\\:;\"'<>,.?/~`"
         ]
-
-        def text_encoding():
-            self.ctx.begin()
-            if self.ctx.begin_window("Text", pymui.rect(10, 10, 400, 300)):
-                for text in test_strings:
-                    self.ctx.label(text)
-                    self.ctx.text(text)
-                self.ctx.end_window()
-            self.ctx.end()
+        ctx = self.ctx
+
+        def text_encoding(begin=ctx.begin, end=ctx.end, begin_window=ctx.begin_window,
+                          end_window=ctx.end_window, label=ctx.label, text=ctx.text,
+                          win_rect=pymui.rect(10, 10, 400, 300)):
+            begin()
+            if begin_window("Text", win_rect):
+                for s in test_strings:
+                    label(s)
+                    text(s)
+                end_window()
+            end()
 
         return benchmark(text_encoding, iterations=100)
 
     def benchmark_memory_operations(self):
         """Benchmark memory-intensive operations."""
-        def memory_ops():
+        large_text = "Large buffer test " * 20
+
+        def memory_ops(Textbox=pymui.Textbox):
             # Test textbox with various buffer sizes
-            tb_small = pymui.Textbox(64)
-            tb_medium = pymui.Textbox(256)
-            tb_large = pymui.Textbox(1024)
+            tb_small = Textbox(64)
+            tb_medium = Textbox(256)
+            tb_large = Textbox(1024)
 
             # Set and get text
             tb_small.text = "Small buffer test"
             tb_medium.text = "Medium buffer test with more content"
-            tb_large.text = "Large buffer test " * 20
+            tb_large.text = large_text
 
-            # Access text properties
-            _ = tb_small.text + tb_medium.text + tb_large.text
+            # Access text properties without concatenating the results
+            _ = len(tb_small.text) + len(tb_medium.text) + len(tb_large.text)
 
         return benchmark(memory_ops, iterations=500)
 
     def benchmark_complex_ui(self):
         """Benchmark complex UI with multiple widgets."""
-        def complex_ui():
-            self.ctx.begin()
+        ctx = self.ctx
+        # Titles, rects and labels are invariant, so build them once
+        windows = [(f"Window {i}", pymui.rect(i*150, i*100, 200, 150)) for i in range(3)]
+        widgets = [(j, f"Label {j}", f"Button {j}", float(j * 20)) for j in range(5)]
+        row_widths = (80, -1)
+
+        def complex_ui(begin=ctx.begin, end=ctx.end, begin_window=ctx.begin_window,
+                       end_window=ctx.end_window, layout_row=ctx.layout_row,
+                       label=ctx.label, button=ctx.button, slider=ctx.slider):
+            begin()
 
             # Multiple windows
-            for i in range(3):
-                if self.ctx.begin_window(f"Window {i}", pymui.rect(i*150, i*100, 200, 150)):
-                    self.ctx.layout_row([80, -1], 0)
+            for title, win_rect in windows:
+                if begin_window(title, win_rect):
+                    layout_row(row_widths, 0)
 
                     # Multiple widgets per window
-                    for j in range(5):
-                        self.ctx.label(f"Label {j}")
+                    for j, label_text, button_text, value in widgets:
+                        label(label_text)
                         if j % 2 == 0:
-                            self.ctx.button(f"Button {j}")
+                            button(button_text)
                         else:
-                            result, val = self.ctx.slider(float(j * 20), 0.0, 100.0)
+                            result, val = slider(value, 0.0, 100.0)
 
-                    self.ctx.end_window()
+                    end_window()
 
-            self.ctx.end()
+            end()
 
         return benchmark(complex_ui, iterations=50)
 
@@ -196,6 +351,7 @@ class PerformanceBenchmarks:
         """Run all performance benchmarks."""
         benchmarks = [
             ("Context Creation", self.benchmark_context_creation),
+            ("Context Destruction", self.benchmark_context_destruction),
             ("Basic Objects", self.benchmark_basic_objects),
             ("Frame Cycle", self.benchmark_frame_cycle),
             ("Simple Window", self.benchmark_simple_window),
@@ -209,24 +365,35 @@ class PerformanceBenchmarks:
         print("PyMUI Performance Benchmarks")
         print("=" * 50)
 
-        for name, benchmark_func in benchmarks:
-            print(f"\nRunning {name}...")
-            try:
+        with pinned_cpu():
+            for name, benchmark_func in benchmarks:
+                self._run_benchmark(name, benchmark_func)
+
+        return self.results
+
+    def _run_benchmark(self, name, benchmark_func):
+        """Run one benchmark, then report it in a single write."""
+        out = io.StringIO()
+        print(f"\nRunning {name}...", file=out)
+        try:
+            # Keep cyclic GC from running inside the measurement
+            with gc_disabled():
                 result = benchmark_func()
-                self.results[name] = result
+            self.results[name] = result
 
-                print(f"  Mean: {result['mean']*1000:.3f}ms")
-                print(f"  Median: {result['median']*1000:.3f}ms")
-                print(f"  Min: {result['min']*1000:.3f}ms")
-                print(f"  Max: {result['max']*1000:.3f}ms")
-                print(f"  StdDev: {result['stdev']*1000:.3f}ms")
-                print(f"  Iterations: {result['iterations']}")
+            print(f"  Mean: {result['mean']*1000:.3f}ms", file=out)
+            print(f"  Median: {result['median']*1000:.3f}ms", file=out)
+            print(f"  Min: {result['min']*1000:.3f}ms", file=out)
+            print(f"  Max: {result['max']*1000:.3f}ms", file=out)
+            print(f"  StdDev: {result['stdev']*1000:.3f}ms", file=out)
+            print(f"  Iterations: {result['iterations']}", file=out)
 
-            except Exception as e:
-                print(f"  ERROR: {e}")
-                self.results[name] = {"error": str(e)}
+        except Exception as e:
+            print(f"  ERROR: {e}", file=out)
+            self.results[name] = {"error": str(e)}
 
-        return self.results
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
 
     def save_baseline(self, filename="performance_baseline.txt"):
         """Save current results as performance baseline."""
@@ -255,25 +422,33 @@ class PerformanceBenchmarks:
 
             baseline_results = baseline['results']
 
-            for name, current in self.results.items():
-                if name in baseline_results and 'error' not in current and 'error' not in baseline_results[name]:
-                    baseline_mean = baseline_results[name]['mean']
-                    current_mean = current['mean']
-
-                    if baseline_mean > 0:
-                        change_percent = ((current_mean - baseline_mean) / baseline_mean) * 100
-                        change_str = f"{change_percent:+.1f}%"
+            # Pack comparable means into aligned columns, then compute every
+            # percentage change in one pass before formatting
+            names = [name for name, current in self.results.items()
+                     if name in baseline_results and 'error' not in current
+                     and 'error' not in baseline_results[name]]
+            cur = [self.results[name]['mean'] for name in names]
+            base = [baseline_results[name]['mean'] for name in names]
+            pct = [(c - b) / b * 100 if b > 0 else None for c, b in zip(cur, base)]
+            comparable = dict(zip(names, zip(cur, base, pct)))
+
+            for name in self.results:
+                if name not in comparable:
+                    print(f"{name:20} No baseline comparison available")
+                    continue
 
-                        if abs(change_percent) > 10:  # Significant change threshold
-                            status = "⚠️  SIGNIFICANT" if change_percent > 0 else "✅ IMPROVED"
-                        else:
-                            status = "✓ OK"
+                current_mean, baseline_mean, change_percent = comparable[name]
+                if change_percent is None:
+                    print(f"{name:20} {current_mean*1000:6.2f}ms vs {baseline_mean*1000:6.2f}ms (baseline invalid)")
+                    continue
 
-                        print(f"{name:20} {current_mean*1000:6.2f}ms vs {baseline_mean*1000:6.2f}ms ({change_str:8}) {status}")
-                    else:
-                        print(f"{name:20} {current_mean*1000:6.2f}ms vs {baseline_mean*1000:6.2f}ms (baseline invalid)")
+                change_str = f"{change_percent:+.1f}%"
+                if abs(change_percent) > 10:  # Significant change threshold
+                    status = "⚠️  SIGNIFICANT" if change_percent > 0 else "✅ IMPROVED"
                 else:
-                    print(f"{name:20} No baseline comparison available")
+                    status = "✓ OK"
+
+                print(f"{name:20} {current_mean*1000:6.2f}ms vs {baseline_mean*1000:6.2f}ms ({change_str:8}) {status}")
 
         except FileNotFoundError:
             print(f"No baseline file found: {filename}")
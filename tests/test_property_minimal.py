@@ -6,33 +6,60 @@ This focuses on data structure properties without complex UI operations
 to avoid crashes while still providing comprehensive edge case testing.
 """
 
-import sys
-from pathlib import Path
+from functools import lru_cache
 
-# Add src to path for imports
-ROOTDIR = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(ROOTDIR))
+import pytest
+
+# src/ is put on sys.path by conftest.py
+pytest.importorskip("hypothesis")
+
+import _hypothesis_profiles  # noqa: F401  (loads HYPOTHESIS_PROFILE)
+from hypothesis import Phase, example, given, settings, strategies as st
+from hypothesis.strategies import integers, floats
+
+import pymui
+
+
+# Shared strategies; one instance per range instead of one per decorator
+INT_10K = integers(min_value=-10000, max_value=10000)
+NONNEG_10K = integers(min_value=0, max_value=10000)
+INT_1K = integers(min_value=-1000, max_value=1000)
+NONNEG_1K = integers(min_value=0, max_value=1000)
+U8 = integers(min_value=0, max_value=255)
+# Whole Rect/Color argument tuples, drawn in one go
+XYWH_10K = st.tuples(INT_10K, INT_10K, NONNEG_10K, NONNEG_10K)
+XYWH_1K = st.tuples(INT_1K, INT_1K, NONNEG_1K, NONNEG_1K)
+RGBA = st.tuples(U8, U8, U8, U8)
+
+# Getter/setter roundtrips fail on their first counterexample, so skip
+# shrinking and targeting; explicit @example cases still always run
+ROUNDTRIP = settings(phases=[Phase.explicit, Phase.reuse, Phase.generate])
+
+# ASCII texts around the 50-byte textbox buffer, built once
+ASCII_SAMPLES = tuple("A" * n for n in (0, 1, 5, 12, 32, 48, 49, 50, 51, 63, 100))
 
-try:
-    from hypothesis import given, strategies as st
-    from hypothesis.strategies import integers, floats
-except ImportError:
-    import pytest
-    pytest.skip("Hypothesis not available", allow_module_level=True)
 
-try:
-    from pymui import pymui
-except ImportError:
-    import pymui
+@lru_cache(maxsize=256)
+def _textbox(buffer_size):
+    """One Textbox per buffer size, reused across Hypothesis examples.
+
+    Callers reset .text first; tests of a fresh Textbox create their own.
+    """
+    return pymui.Textbox(buffer_size)
 
 
 class TestDataStructureProperties:
     """Property-based tests for basic data structures."""
 
-    @given(x=integers(min_value=-10000, max_value=10000),
-           y=integers(min_value=-10000, max_value=10000))
-    def test_vec2_invariants(self, x, y):
-        """Test Vec2 invariants and properties."""
+    @ROUNDTRIP
+    @given(t=st.tuples(INT_10K, INT_10K))
+    @example(t=(5, 7))
+    @example(t=(0, 0))
+    @example(t=(-10000, 10000))
+    @example(t=(1000000, -1000000))
+    def test_vec2_all_invariants(self, t):
+        """Test Vec2 creation and mutation."""
+        x, y = t
         vec = pymui.Vec2(x, y)
 
         # Basic properties
@@ -46,18 +73,14 @@ class TestDataStructureProperties:
         assert vec.x == new_x
         assert vec.y == new_y
 
-        # String representation should be reasonable
-        repr_str = repr(vec)
-        assert "Vec2" in repr_str
-        assert isinstance(repr_str, str)
-        assert len(repr_str) > 0
-
-    @given(x=integers(min_value=-10000, max_value=10000),
-           y=integers(min_value=-10000, max_value=10000),
-           w=integers(min_value=0, max_value=10000),
-           h=integers(min_value=0, max_value=10000))
-    def test_rect_invariants(self, x, y, w, h):
-        """Test Rect invariants and properties."""
+    @ROUNDTRIP
+    @given(t=XYWH_10K)
+    @example(t=(5, 7, 10, 20))
+    @example(t=(0, 0, 0, 0))
+    @example(t=(-100000, -100000, 200000, 200000))
+    def test_rect_all_invariants(self, t):
+        """Test Rect creation and mutation."""
+        x, y, w, h = t
         rect = pymui.Rect(x, y, w, h)
 
         # Basic properties
@@ -66,17 +89,17 @@ class TestDataStructureProperties:
         assert rect.w == w
         assert rect.h == h
 
-        # String representation should be reasonable
-        repr_str = repr(rect)
-        assert "Rect" in repr_str
-        assert isinstance(repr_str, str)
-
-    @given(r=integers(min_value=0, max_value=255),
-           g=integers(min_value=0, max_value=255),
-           b=integers(min_value=0, max_value=255),
-           a=integers(min_value=0, max_value=255))
-    def test_color_invariants(self, r, g, b, a):
-        """Test Color invariants and properties."""
+        # Mutation should work
+        rect.x, rect.y, rect.w, rect.h = y, x, h, w
+        assert (rect.x, rect.y, rect.w, rect.h) == (y, x, h, w)
+
+    @ROUNDTRIP
+    @given(t=RGBA)
+    @example(t=(0, 0, 0, 0))
+    @example(t=(255, 255, 255, 255))
+    def test_color_all_invariants(self, t):
+        """Test Color creation and mutation."""
+        r, g, b, a = t
         color = pymui.Color(r, g, b, a)
 
         # Basic properties
@@ -85,21 +108,40 @@ class TestDataStructureProperties:
         assert color.b == b
         assert color.a == a
 
-        # Components should stay in valid range
-        assert 0 <= color.r <= 255
-        assert 0 <= color.g <= 255
-        assert 0 <= color.b <= 255
-        assert 0 <= color.a <= 255
+        # Mutation should work, and components stay in valid range
+        color.r, color.g, color.b, color.a = a, b, g, r
+        assert (color.r, color.g, color.b, color.a) == (a, b, g, r)
+
+    # repr() formatting does not depend on the drawn values, so it is
+    # checked once per type rather than on every example
+    def test_vec2_repr(self):
+        """Test Vec2 repr names the type and its fields."""
+        repr_str = repr(pymui.Vec2(-12, 34))
+        assert "Vec2" in repr_str
+        assert "-12" in repr_str and "34" in repr_str
+
+    def test_rect_repr(self):
+        """Test Rect repr names the type and its fields."""
+        repr_str = repr(pymui.Rect(-1, 2, 30, 40))
+        assert "Rect" in repr_str
+        assert all(v in repr_str for v in ("-1", "2", "30", "40"))
+
+    def test_color_repr(self):
+        """Test Color repr names the type and its components."""
+        repr_str = repr(pymui.Color(1, 22, 133, 244))
+        assert "Color" in repr_str
+        assert all(v in repr_str for v in ("1", "22", "133", "244"))
 
-    @given(r=integers(min_value=0, max_value=255),
-           g=integers(min_value=0, max_value=255),
-           b=integers(min_value=0, max_value=255))
+    @ROUNDTRIP
+    @given(r=U8, g=U8, b=U8)
     def test_color_default_alpha_consistency(self, r, g, b):
         """Test that default alpha is consistently applied."""
         color = pymui.Color(r, g, b)
         assert color.a == 255
 
     @given(buffer_size=integers(min_value=2, max_value=1024))
+    @example(buffer_size=2)
+    @example(buffer_size=1024)
     def test_textbox_creation_properties(self, buffer_size):
         """Test Textbox creation properties."""
         textbox = pymui.Textbox(buffer_size)
@@ -111,7 +153,7 @@ class TestDataStructureProperties:
         textbox.text = "test"
         result = textbox.text
         # For very small buffers, text may be truncated
-        if buffer_size >= len("test".encode('utf-8')) + 1:
+        if buffer_size >= len("test") + 1:
             assert result == "test"
         else:
             # Text was truncated but should not crash
@@ -132,8 +174,8 @@ class TestDataStructureProperties:
 class TestGlobalFunctionProperties:
     """Property-based tests for global convenience functions."""
 
-    @given(x=integers(min_value=-1000, max_value=1000),
-           y=integers(min_value=-1000, max_value=1000))
+    @ROUNDTRIP
+    @given(x=INT_1K, y=INT_1K)
     def test_vec2_function_consistency(self, x, y):
         """Global vec2() should be consistent with Vec2() constructor."""
         direct = pymui.Vec2(x, y)
@@ -142,28 +184,24 @@ class TestGlobalFunctionProperties:
         assert direct.x == via_function.x
         assert direct.y == via_function.y
 
-    @given(x=integers(min_value=-1000, max_value=1000),
-           y=integers(min_value=-1000, max_value=1000),
-           w=integers(min_value=0, max_value=1000),
-           h=integers(min_value=0, max_value=1000))
-    def test_rect_function_consistency(self, x, y, w, h):
+    @ROUNDTRIP
+    @given(xywh=XYWH_1K)
+    def test_rect_function_consistency(self, xywh):
         """Global rect() should be consistent with Rect() constructor."""
-        direct = pymui.Rect(x, y, w, h)
-        via_function = pymui.rect(x, y, w, h)
+        direct = pymui.Rect(*xywh)
+        via_function = pymui.rect(*xywh)
 
         assert direct.x == via_function.x
         assert direct.y == via_function.y
         assert direct.w == via_function.w
         assert direct.h == via_function.h
 
-    @given(r=integers(min_value=0, max_value=255),
-           g=integers(min_value=0, max_value=255),
-           b=integers(min_value=0, max_value=255),
-           a=integers(min_value=0, max_value=255))
-    def test_color_function_consistency(self, r, g, b, a):
+    @ROUNDTRIP
+    @given(rgba=RGBA)
+    def test_color_function_consistency(self, rgba):
         """Global color() should be consistent with Color() constructor."""
-        direct = pymui.Color(r, g, b, a)
-        via_function = pymui.color(r, g, b, a)
+        direct = pymui.Color(*rgba)
+        via_function = pymui.color(*rgba)
 
         assert direct.r == via_function.r
         assert direct.g == via_function.g
@@ -174,14 +212,12 @@ class TestGlobalFunctionProperties:
 class TestMemorySafetyProperties:
     """Property-based tests for memory safety."""
 
-    @given(text_length=integers(min_value=0, max_value=100))
-    def test_textbox_buffer_safety(self, text_length):
+    @given(test_text=st.sampled_from(ASCII_SAMPLES))
+    def test_textbox_buffer_safety(self, test_text):
         """Test that textbox operations are memory safe."""
         buffer_size = 50
-        textbox = pymui.Textbox(buffer_size)
-
-        # Create text of specified length
-        test_text = "A" * text_length
+        textbox = _textbox(buffer_size)
+        textbox.text = ""
 
         # This should not crash regardless of text length
         textbox.text = test_text
@@ -193,62 +229,16 @@ class TestMemorySafetyProperties:
         # Result should not exceed buffer capacity
         assert len(result.encode('utf-8')) < buffer_size
 
-    @given(iterations=integers(min_value=1, max_value=20))
-    def test_repeated_context_creation(self, iterations):
+    def test_repeated_context_creation(self):
         """Test that repeated Context creation/destruction is stable."""
-        contexts = []
-
-        # Create multiple contexts
-        for _ in range(iterations):
+        # Creation does not depend on any input, so a few plain rounds
+        # cover it; each context is released before the next is built
+        for _ in range(3):
             ctx = pymui.Context()
-            contexts.append(ctx)
-
-        # All should be valid
-        for ctx in contexts:
-            assert isinstance(ctx, pymui.Context)
-
-        # Clean up (destructors should handle this safely)
-        del contexts
-
-
-class TestEdgeCaseRegression:
-    """Tests for specific edge cases that have been problematic."""
-
-    def test_zero_dimensions(self):
-        """Test zero dimensions are handled safely."""
-        # Zero-size rect
-        rect = pymui.Rect(0, 0, 0, 0)
-        assert rect.w == 0
-        assert rect.h == 0
-
-        # Zero position
-        vec = pymui.Vec2(0, 0)
-        assert vec.x == 0
-        assert vec.y == 0
-
-    def test_boundary_values(self):
-        """Test boundary values for all types."""
-        # Color boundaries
-        black = pymui.Color(0, 0, 0, 0)
-        white = pymui.Color(255, 255, 255, 255)
-        assert black.r == 0 and white.r == 255
-
-        # Minimum textbox
-        textbox = pymui.Textbox(2)  # Minimum size
-        textbox.text = ""
-        assert textbox.text == ""
-
-    def test_large_values(self):
-        """Test large but reasonable values."""
-        # Large coordinates
-        big_vec = pymui.Vec2(1000000, -1000000)
-        assert big_vec.x == 1000000
-        assert big_vec.y == -1000000
-
-        # Large rect
-        big_rect = pymui.Rect(-100000, -100000, 200000, 200000)
-        assert big_rect.w == 200000
-        assert big_rect.h == 200000
+            try:
+                assert isinstance(ctx, pymui.Context)
+            finally:
+                del ctx
 
 
 if __name__ == "__main__":
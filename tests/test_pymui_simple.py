@@ -5,9 +5,45 @@ This version doesn't require SDL2 and just prints UI commands for testing
 """
 
 import sys
+from array import array
+from functools import lru_cache
 from pymui import Context, Rect, Color, Vec2, Option, Result, Mouse, Key, ColorIndex
 
 
+@lru_cache(maxsize=1024)
+def _measure_text(font_width, text, length):
+    """Width of the first length characters of text (memoized per string)"""
+    return length * font_width
+
+
+@lru_cache(maxsize=256)
+def _hex_color(r, g, b):
+    """Format an RGB triple as #RRGGBB (memoized; sliders rarely move)"""
+    return f"#{r:02X}{g:02X}{b:02X}"
+
+
+# Frame-invariant window rects and style editor rows, built once
+DEMO_WINDOW_RECT = Rect(40, 40, 300, 450)
+LOG_WINDOW_RECT = Rect(350, 40, 300, 200)
+STYLE_WINDOW_RECT = Rect(350, 250, 300, 240)
+STYLE_COLORS = (
+    ("text:", ColorIndex.TEXT),
+    ("border:", ColorIndex.BORDER),
+    ("windowbg:", ColorIndex.WINDOWBG),
+    ("titlebg:", ColorIndex.TITLEBG),
+    ("titletext:", ColorIndex.TITLETEXT),
+    ("panelbg:", ColorIndex.PANELBG),
+    ("button:", ColorIndex.BUTTON),
+    ("buttonhover:", ColorIndex.BUTTONHOVER),
+    ("buttonfocus:", ColorIndex.BUTTONFOCUS),
+    ("base:", ColorIndex.BASE),
+    ("basehover:", ColorIndex.BASEHOVER),
+    ("basefocus:", ColorIndex.BASEFOCUS),
+    ("scrollbase:", ColorIndex.SCROLLBASE),
+    ("scrollthumb:", ColorIndex.SCROLLTHUMB),
+)
+
+
 class MockRenderer:
     """Mock renderer that just prints commands for testing"""
     
@@ -17,9 +53,10 @@ class MockRenderer:
     
     def get_text_width(self, text, length=-1):
         """Get text width"""
+        # Normalize so ("Red:", -1) and ("Red:", 4) share a cache entry
         if length == -1:
             length = len(text)
-        return length * self.font_width
+        return _measure_text(self.font_width, text, length)
     
     def get_text_height(self):
         """Get text height"""
@@ -39,9 +76,12 @@ class Demo:
         # self.ctx.text_height = self.text_height
         
         # Demo state
-        self.logbuf = ""
+        self.logbuf = []  # Log lines, joined for display only when they change
+        self.log_text = ""
         self.logbuf_updated = False
-        self.bg = [90.0, 95.0, 100.0]  # Use floats for sliders
+        self.bg = array('f', (90.0, 95.0, 100.0))  # Unboxed floats for sliders
+        # One RGBA slider buffer per style editor row, so each slider keeps its id
+        self.style_rgba = tuple(array('f', bytes(4 * 4)) for _ in STYLE_COLORS)
         self.input_buf = ""
         
         # Track commands for testing
@@ -59,15 +99,13 @@ class Demo:
     
     def write_log(self, text):
         """Write text to log buffer"""
-        if self.logbuf:
-            self.logbuf += "\n"
-        self.logbuf += text
+        self.logbuf.append(text)
         self.logbuf_updated = True
         print(f"LOG: {text}")
     
     def test_window(self):
         """Create the main demo window"""
-        if self.ctx.begin_window("Demo Window", Rect(40, 40, 300, 450)):
+        if self.ctx.begin_window("Demo Window", DEMO_WINDOW_RECT):
             print("Created Demo Window")
             
             # Window info
@@ -183,23 +221,28 @@ class Demo:
                 self.ctx.layout_end_column()
                 
                 # Color preview
+                # Convert the slider floats to channel bytes once per frame
+                red, green, blue = map(int, self.bg)
                 r = self.ctx.layout_next()
-                self.ctx.draw_rect(r, Color(int(self.bg[0]), int(self.bg[1]), int(self.bg[2]), 255))
-                color_text = f"#{int(self.bg[0]):02X}{int(self.bg[1]):02X}{int(self.bg[2]):02X}"
+                self.ctx.draw_rect(r, Color(red, green, blue, 255))
+                color_text = _hex_color(red, green, blue)
                 print(f"    Color preview: {color_text}")
             
             self.ctx.end_window()
     
     def log_window(self):
         """Create the log window"""
-        if self.ctx.begin_window("Log Window", Rect(350, 40, 300, 200)):
+        if self.ctx.begin_window("Log Window", LOG_WINDOW_RECT):
             print("Created Log Window")
             
             # Output text panel
             self.ctx.layout_height(-25)
             self.ctx.begin_panel("Log Output")
             self.ctx.layout_height(-1)
-            self.ctx.text(self.logbuf)
+            if self.logbuf_updated:
+                self.log_text = "\n".join(self.logbuf)
+                self.logbuf_updated = False
+            self.ctx.text(self.log_text)
             self.ctx.end_panel()
             
             # Input textbox + submit button
@@ -223,43 +266,23 @@ class Demo:
     
     def style_window(self):
         """Create the style editor window"""
-        colors = [
-            ("text:", ColorIndex.TEXT),
-            ("border:", ColorIndex.BORDER),
-            ("windowbg:", ColorIndex.WINDOWBG),
-            ("titlebg:", ColorIndex.TITLEBG),
-            ("titletext:", ColorIndex.TITLETEXT),
-            ("panelbg:", ColorIndex.PANELBG),
-            ("button:", ColorIndex.BUTTON),
-            ("buttonhover:", ColorIndex.BUTTONHOVER),
-            ("buttonfocus:", ColorIndex.BUTTONFOCUS),
-            ("base:", ColorIndex.BASE),
-            ("basehover:", ColorIndex.BASEHOVER),
-            ("basefocus:", ColorIndex.BASEFOCUS),
-            ("scrollbase:", ColorIndex.SCROLLBASE),
-            ("scrollthumb:", ColorIndex.SCROLLTHUMB),
-        ]
-        
-        if self.ctx.begin_window("Style Editor", Rect(350, 250, 300, 240)):
+        if self.ctx.begin_window("Style Editor", STYLE_WINDOW_RECT):
             print("Created Style Editor Window")
             
             # Note: get_current_container is not available, so we'll use a fixed width
             sw = 40  # Fixed width for sliders
             
-            for label, color_idx in colors:
+            for (label, color_idx), rgba in zip(STYLE_COLORS, self.style_rgba):
                 self.ctx.layout_width(80)
                 self.ctx.label(label)
                 color = self.ctx.style.get_color(color_idx)
                 
-                # Create sliders for RGBA values
-                self.ctx.layout_width(sw)
-                self.ctx.slider(float(color.r), 0, 255)
-                self.ctx.layout_width(sw)
-                self.ctx.slider(float(color.g), 0, 255)
-                self.ctx.layout_width(sw)
-                self.ctx.slider(float(color.b), 0, 255)
-                self.ctx.layout_width(sw)
-                self.ctx.slider(float(color.a), 0, 255)
+                # Create sliders for RGBA values in one call over the row's buffer
+                rgba[0] = color.r
+                rgba[1] = color.g
+                rgba[2] = color.b
+                rgba[3] = color.a
+                self.ctx.slider_row(rgba, 0, 255, sw)
                 
                 self.ctx.layout_width(-1)
                 self.ctx.draw_rect(self.ctx.layout_next(), color)
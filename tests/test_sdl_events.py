@@ -36,28 +36,39 @@ def main():
         running = True
         event_count = 0
 
+        # SDL_PollEvent overwrites the event in place, so allocate it once;
+        # the poll function and event types are bound to locals for the loop
+        event = sdl2.SDL_Event()
+        event_ref = ctypes.byref(event)
+        poll = sdl2.SDL_PollEvent
+        QUIT = sdl2.SDL_QUIT
+        KEYDOWN = sdl2.SDL_KEYDOWN
+        MMOTION = sdl2.SDL_MOUSEMOTION
+        MBDOWN = sdl2.SDL_MOUSEBUTTONDOWN
+        MBUP = sdl2.SDL_MOUSEBUTTONUP
+        ESC = sdl2.SDLK_ESCAPE
         while running and event_count < 100:  # Limit events for testing
-            event = sdl2.SDL_Event()
-            while sdl2.SDL_PollEvent(ctypes.byref(event)):
+            while poll(event_ref):
                 event_count += 1
-                print(f"Event {event_count}: type={event.type}")
+                etype = event.type
+                print(f"Event {event_count}: type={etype}")
 
-                if event.type == sdl2.SDL_QUIT:
+                if etype == QUIT:
                     print("  -> SDL_QUIT")
                     running = False
-                elif event.type == sdl2.SDL_KEYDOWN:
+                elif etype == KEYDOWN:
                     print(f"  -> SDL_KEYDOWN: key={event.key.keysym.sym}")
-                    if event.key.keysym.sym == sdl2.SDLK_ESCAPE:
+                    if event.key.keysym.sym == ESC:
                         print("  -> Escape pressed, exiting")
                         running = False
-                elif event.type == sdl2.SDL_MOUSEMOTION:
+                elif etype == MMOTION:
                     print(f"  -> SDL_MOUSEMOTION: ({event.motion.x}, {event.motion.y})")
-                elif event.type == sdl2.SDL_MOUSEBUTTONDOWN:
+                elif etype == MBDOWN:
                     print(f"  -> SDL_MOUSEBUTTONDOWN: button={event.button.button} at ({event.button.x}, {event.button.y})")
-                elif event.type == sdl2.SDL_MOUSEBUTTONUP:
+                elif etype == MBUP:
                     print(f"  -> SDL_MOUSEBUTTONUP: button={event.button.button} at ({event.button.x}, {event.button.y})")
                 else:
-                    print(f"  -> Other event type: {event.type}")
+                    print(f"  -> Other event type: {etype}")
 
             # Clear screen to keep window responsive
             sdl2.SDL_GL_SwapWindow(window)
@@ -32,10 +32,12 @@ def main():
         running = True
         click_count = 0
 
+        # SDL_PollEvent overwrites the event in place, so allocate it once
+        event = sdl2.SDL_Event()
+        event_ref = ctypes.byref(event)
         while running:
             # Handle SDL events
-            event = sdl2.SDL_Event()
-            while sdl2.SDL_PollEvent(ctypes.byref(event)):
+            while sdl2.SDL_PollEvent(event_ref):
                 if event.type == sdl2.SDL_QUIT:
                     print("Quit event received")
                     running = False
@@ -73,21 +75,8 @@ def main():
             # Render
             pymui.renderer_clear(pymui.color(32, 32, 32, 255))
 
-            # Process commands
-            ctx.reset_command_iterator()
-            while True:
-                cmd = ctx.next_command()
-                if cmd is None:
-                    break
-
-                if cmd.type == pymui.Command.TEXT:
-                    pymui.renderer_draw_text(cmd.text, cmd.pos, cmd.color)
-                elif cmd.type == pymui.Command.RECT:
-                    pymui.renderer_draw_rect(cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.ICON:
-                    pymui.renderer_draw_icon(cmd.icon_id, cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.CLIP:
-                    pymui.renderer_set_clip_rect(cmd.rect)
+            # Walk the command list in C and draw each command directly
+            pymui.render_all_commands(ctx)
 
             pymui.renderer_present()
 
@@ -3,6 +3,7 @@
 import sys
 import ctypes
 import sdl2
+from array import array
 from pathlib import Path
 
 ROOTDIR = Path(__file__).parent.parent / "src"
@@ -14,13 +15,16 @@ except ImportError:
     from pymui import pymui
 
 
-def test_text_rendering(ctx):
-    """Test window to verify text rendering fix"""
-    # Properly initialize frame
-    ctx.begin()
+# Frame-invariant layout and colors, built once; microui copies them per use
+LABEL_ROW = array('i', (150, -1))
+WINDOW_RECT = pymui.rect(100, 100, 300, 200)
+CLEAR_COLOR = pymui.color(64, 64, 64, 255)
+
 
-    if ctx.begin_window("Text Test", pymui.rect(100, 100, 300, 200)):
-        ctx.layout_row([150, -1], 0)
+def text_window(ctx):
+    """Test window to verify text rendering fix (run between begin/end)"""
+    if ctx.begin_window("Text Test", WINDOW_RECT):
+        ctx.layout_row(LABEL_ROW, 0)
 
         # Test various text elements
         ctx.label("Label text:")
@@ -41,7 +45,11 @@ def test_text_rendering(ctx):
 
         ctx.end_window()
 
-    # Properly end frame
+
+def test_text_rendering(ctx):
+    """Build the text test window in a standalone frame"""
+    ctx.begin()
+    text_window(ctx)
     ctx.end()
 
 
@@ -60,60 +68,88 @@ def main():
         frame_count = 0
         max_frames = 120  # Run for ~2 seconds at 60fps
 
+        # SDL_PollEvent overwrites the event in place, so allocate it once;
+        # the poll function and event types are bound to locals for the loop
+        event = sdl2.SDL_Event()
+        event_ref = ctypes.byref(event)
+        poll = sdl2.SDL_PollEvent
+        QUIT = sdl2.SDL_QUIT
+        KEYDOWN = sdl2.SDL_KEYDOWN
+        MBDOWN = sdl2.SDL_MOUSEBUTTONDOWN
+        MBUP = sdl2.SDL_MOUSEBUTTONUP
+        ESC = sdl2.SDLK_ESCAPE
+        LEFT = sdl2.SDL_BUTTON_LEFT
+        MOUSE_LEFT = pymui.Mouse.LEFT
+        # Command types and their draw calls for the inspection walk;
+        # iter_commands() yields arguments in renderer order
+        CMD_TEXT = pymui.Command.TEXT
+        draw = {
+            CMD_TEXT: pymui.renderer_draw_text,
+            pymui.Command.RECT: pymui.renderer_draw_rect,
+            pymui.Command.ICON: pymui.renderer_draw_icon,
+            pymui.Command.CLIP: pymui.renderer_set_clip_rect,
+        }
+        wait = sdl2.SDL_WaitEventTimeout
+        dirty = True
         while frame_count < max_frames:
             frame_count += 1
 
+            # When idle, block until input arrives (or 20ms pass) instead of
+            # rebuilding an unchanged UI; the event stays queued for the poll
+            if not dirty:
+                wait(None, 20)
+
             # Handle SDL events
-            event = sdl2.SDL_Event()
-            while sdl2.SDL_PollEvent(ctypes.byref(event)):
-                if event.type == sdl2.SDL_QUIT:
+            while poll(event_ref):
+                dirty = True
+                etype = event.type
+                if etype == QUIT:
                     print("Quit event received")
                     return 0
-                elif event.type == sdl2.SDL_KEYDOWN and event.key.keysym.sym == sdl2.SDLK_ESCAPE:
+                elif etype == KEYDOWN and event.key.keysym.sym == ESC:
                     print("Escape pressed")
                     return 0
-                elif event.type == sdl2.SDL_MOUSEBUTTONDOWN:
-                    if event.button.button == sdl2.SDL_BUTTON_LEFT:
-                        ctx.input_mousedown(event.button.x, event.button.y, pymui.Mouse.LEFT)
-                elif event.type == sdl2.SDL_MOUSEBUTTONUP:
-                    if event.button.button == sdl2.SDL_BUTTON_LEFT:
-                        ctx.input_mouseup(event.button.x, event.button.y, pymui.Mouse.LEFT)
+                elif etype == MBDOWN:
+                    if event.button.button == LEFT:
+                        ctx.input_mousedown(event.button.x, event.button.y, MOUSE_LEFT)
+                elif etype == MBUP:
+                    if event.button.button == LEFT:
+                        ctx.input_mouseup(event.button.x, event.button.y, MOUSE_LEFT)
+
+            if not dirty:
+                continue
 
             # Process frame
             ctx.begin()
-            test_text_rendering(ctx)
+            text_window(ctx)
             ctx.end()
 
             # Render and capture text commands for debugging
-            pymui.renderer_clear(pymui.color(64, 64, 64, 255))
-
-            # Process commands and check text
-            ctx.reset_command_iterator()
-            text_commands = 0
-            while True:
-                cmd = ctx.next_command()
-                if cmd is None:
-                    break
-
-                if cmd.type == pymui.Command.TEXT:
-                    text_commands += 1
-                    # Check for garbage characters on first few frames
-                    if frame_count <= 5:
-                        text = cmd.text
-                        if '@' in text or '[' in text or ']' in text:
-                            print(f"WARNING: Found potential garbage in text: '{text}'")
+            pymui.renderer_clear(CLEAR_COLOR)
+
+            # Check text on the first few frames; after that, hand the whole
+            # command list to the C-level renderer walk
+            if frame_count <= 5:
+                text_commands = 0
+                for cmd_type, args in ctx.iter_commands():
+                    if cmd_type == CMD_TEXT:
+                        text_commands += 1
+                        # Check for garbage characters on the raw bytes; the
+                        # same bytes go to the renderer, so only the report
+                        # lines decode
+                        text = args[0]
+                        if b'@' in text or b'[' in text or b']' in text:
+                            print(f"WARNING: Found potential garbage in text: '{text.decode('utf-8', 'replace')}'")
                         elif frame_count == 1 and text_commands <= 3:
-                            print(f"Clean text found: '{text}'")
-
-                    pymui.renderer_draw_text(cmd.text.encode('utf-8'), cmd.pos, cmd.color)
-                elif cmd.type == pymui.Command.RECT:
-                    pymui.renderer_draw_rect(cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.ICON:
-                    pymui.renderer_draw_icon(cmd.icon_id, cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.CLIP:
-                    pymui.renderer_set_clip_rect(cmd.rect)
+                            print(f"Clean text found: '{text.decode('utf-8', 'replace')}'")
+                    draw[cmd_type](*args)
+            else:
+                pymui.render_all_commands(ctx)
 
             pymui.renderer_present()
+            # Keep redrawing through the inspected frames, then only while
+            # the command list is still changing
+            dirty = frame_count < 5 or ctx.commands_changed()
 
             # Report on first frame
             if frame_count == 1:
@@ -3,6 +3,7 @@
 import sys
 import ctypes
 import sdl2
+from functools import lru_cache
 from pathlib import Path
 
 ROOTDIR = Path(__file__).parent.parent / "src"
@@ -14,6 +15,28 @@ except ImportError:
     from pymui import pymui
 
 
+# Byte offset of the text payload within SDL_Event (text is a union member at 0)
+_TEXTINPUT_OFFSET = sdl2.SDL_TextInputEvent.text.offset
+
+# Events are drained in batches after a single SDL_PumpEvents() per frame
+_EVT_BATCH = 64
+
+# Frame-invariant window rect and clear color, built once
+WINDOW_RECT = pymui.rect(100, 100, 300, 200)
+CLEAR_COLOR = pymui.color(32, 32, 32, 255)
+
+
+# Status labels are formatted once per distinct value, not once per frame
+@lru_cache(maxsize=1)
+def _text_label(text):
+    return f"Current text: '{text}'"
+
+
+@lru_cache(maxsize=1)
+def _submissions_label(count):
+    return f"Submissions: {count}"
+
+
 def main():
     """Test text input specifically"""
     # Initialize SDL
@@ -33,50 +56,111 @@ def main():
         text_buf = ""
         text_submissions = 0
 
+        # One persistent buffer; SDL_PeepEvents copies a whole batch into it
+        # per call instead of one ctypes crossing per event
+        events = (sdl2.SDL_Event * _EVT_BATCH)()
+        peep = sdl2.SDL_PeepEvents
+        pump = sdl2.SDL_PumpEvents
+        GETEVENT = sdl2.SDL_GETEVENT
+        FIRSTEVENT = sdl2.SDL_FIRSTEVENT
+        LASTEVENT = sdl2.SDL_LASTEVENT
+
+        # Constants and context methods the handlers use, bound to locals
+        ESC = sdl2.SDLK_ESCAPE
+        RETURN = sdl2.SDLK_RETURN
+        BACKSPACE = sdl2.SDLK_BACKSPACE
+        BTN_LEFT = sdl2.SDL_BUTTON_LEFT
+        MOUSE_LEFT = pymui.Mouse.LEFT
+        mmove = ctx.input_mousemove
+        mdown = ctx.input_mousedown
+        mup = ctx.input_mouseup
+        kdown = ctx.input_keydown
+        text_in = ctx.input_text
+
+        # Event handlers, looked up by event type; a handler returns True to
+        # stop the loop
+        def on_quit(event):
+            print("Quit event received")
+            return True
+
+        def on_keydown(event):
+            sym = event.key.keysym.sym
+            if sym == ESC:
+                print("Escape pressed")
+                return True
+            # Handle special keys
+            if sym == RETURN:
+                print("Return key pressed")
+                kdown(pymui.Key.RETURN)
+            elif sym == BACKSPACE:
+                print("Backspace key pressed")
+                kdown(pymui.Key.BACKSPACE)
+            return False
+
+        def on_motion(event):
+            mmove(event.motion.x, event.motion.y)
+            return False
+
+        def on_mousedown(event):
+            if event.button.button == BTN_LEFT:
+                mdown(event.button.x, event.button.y, MOUSE_LEFT)
+            return False
+
+        def on_mouseup(event):
+            if event.button.button == BTN_LEFT:
+                mup(event.button.x, event.button.y, MOUSE_LEFT)
+            return False
+
+        def on_text(event):
+            # Read the NUL-terminated payload straight from the event buffer
+            text = ctypes.string_at(ctypes.addressof(event) + _TEXTINPUT_OFFSET).decode('utf-8', 'replace')
+            print(f"Text input received: '{text}'")
+            text_in(text)
+            return False
+
+        handlers = {
+            sdl2.SDL_QUIT: on_quit,
+            sdl2.SDL_KEYDOWN: on_keydown,
+            sdl2.SDL_MOUSEMOTION: on_motion,
+            sdl2.SDL_MOUSEBUTTONDOWN: on_mousedown,
+            sdl2.SDL_MOUSEBUTTONUP: on_mouseup,
+            sdl2.SDL_TEXTINPUT: on_text,
+        }
+        get_handler = handlers.get
+
+        wait = sdl2.SDL_WaitEventTimeout
+        dirty = True
         while running:
+            # When idle, block until input arrives (or 16ms pass) instead of
+            # rebuilding an unchanged UI; the event stays queued for the drain
+            if not dirty:
+                wait(None, 16)
+
             # Handle SDL events
-            event = sdl2.SDL_Event()
-            while sdl2.SDL_PollEvent(ctypes.byref(event)):
-                if event.type == sdl2.SDL_QUIT:
-                    print("Quit event received")
-                    running = False
-                elif event.type == sdl2.SDL_KEYDOWN and event.key.keysym.sym == sdl2.SDLK_ESCAPE:
-                    print("Escape pressed")
-                    running = False
-                elif event.type == sdl2.SDL_MOUSEMOTION:
-                    ctx.input_mousemove(event.motion.x, event.motion.y)
-                elif event.type == sdl2.SDL_MOUSEBUTTONDOWN:
-                    btn = pymui.Mouse.LEFT if event.button.button == sdl2.SDL_BUTTON_LEFT else 0
-                    if btn:
-                        ctx.input_mousedown(event.button.x, event.button.y, btn)
-                elif event.type == sdl2.SDL_MOUSEBUTTONUP:
-                    btn = pymui.Mouse.LEFT if event.button.button == sdl2.SDL_BUTTON_LEFT else 0
-                    if btn:
-                        ctx.input_mouseup(event.button.x, event.button.y, btn)
-                elif event.type == sdl2.SDL_TEXTINPUT:
-                    # Convert bytes to string properly
-                    text_bytes = event.text.text
-                    # Find null terminator
-                    null_pos = text_bytes.find(b'\x00')
-                    if null_pos >= 0:
-                        text_bytes = text_bytes[:null_pos]
-                    text = text_bytes.decode('utf-8', errors='replace')
-                    print(f"Text input received: '{text}'")
-                    ctx.input_text(text)
-                elif event.type == sdl2.SDL_KEYDOWN:
-                    # Handle special keys
-                    if event.key.keysym.sym == sdl2.SDLK_RETURN:
-                        print("Return key pressed")
-                        ctx.input_keydown(pymui.Key.RETURN)
-                    elif event.key.keysym.sym == sdl2.SDLK_BACKSPACE:
-                        print("Backspace key pressed")
-                        ctx.input_keydown(pymui.Key.BACKSPACE)
+            pump()
+            while True:
+                n = peep(events, _EVT_BATCH, GETEVENT, FIRSTEVENT, LASTEVENT)
+                if n < 0:
+                    print(f"SDL_PeepEvents Error: {sdl2.SDL_GetError()}")
+                    break
+                if n:
+                    dirty = True
+                for i in range(n):
+                    event = events[i]
+                    handler = get_handler(event.type)
+                    if handler is not None and handler(event):
+                        running = False
+                if n < _EVT_BATCH:
+                    break
+
+            if not dirty:
+                continue
 
             # Process frame
             ctx.begin()
 
             # Text input test
-            if ctx.begin_window("Text Input Test", pymui.rect(100, 100, 300, 200)):
+            if ctx.begin_window("Text Input Test", WINDOW_RECT):
                 ctx.label("Type in the textbox below:")
                 
                 # Textbox test
@@ -90,33 +174,22 @@ def main():
                     print(f"*** SUBMIT BUTTON CLICKED! Count: {text_submissions}, Text: '{text_buf}' ***")
                 
                 # Show current values
-                ctx.label(f"Current text: '{text_buf}'")
-                ctx.label(f"Submissions: {text_submissions}")
+                ctx.label(_text_label(text_buf))
+                ctx.label(_submissions_label(text_submissions))
                 
                 ctx.end_window()
 
             ctx.end()
 
             # Render
-            pymui.renderer_clear(pymui.color(32, 32, 32, 255))
-
-            # Process commands
-            ctx.reset_command_iterator()
-            while True:
-                cmd = ctx.next_command()
-                if cmd is None:
-                    break
+            pymui.renderer_clear(CLEAR_COLOR)
 
-                if cmd.type == pymui.Command.TEXT:
-                    pymui.renderer_draw_text(cmd.text, cmd.pos, cmd.color)
-                elif cmd.type == pymui.Command.RECT:
-                    pymui.renderer_draw_rect(cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.ICON:
-                    pymui.renderer_draw_icon(cmd.icon_id, cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.CLIP:
-                    pymui.renderer_set_clip_rect(cmd.rect)
+            # Walk the command list in C and draw each command directly
+            pymui.render_all_commands(ctx)
 
             pymui.renderer_present()
+            # Settle: redraw again only while the command list still changes
+            dirty = ctx.commands_changed()
 
         print(f"Test completed. Text submissions: {text_submissions}")
 
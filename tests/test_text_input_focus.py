@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
+import logging
+import os
 import sys
+import time
 import ctypes
 import sdl2
+from functools import lru_cache
 from pathlib import Path
 
 ROOTDIR = Path(__file__).parent.parent / "src"
@@ -13,6 +17,40 @@ except ImportError:
     sys.path.insert(0, str(ROOTDIR))
     from pymui import pymui
 
+from _sdl_harness import _TEXTINPUT_OFFSET, disable_unused_events
+
+
+# Per-event debug output is off by default; set PYMUI_DEBUG=1 to enable it
+DEBUG = os.environ.get("PYMUI_DEBUG") == "1"
+log = logging.getLogger(__name__)
+
+# Events are drained in batches after a single SDL_PumpEvents() per frame
+_EVT_BATCH = 32
+_EVT_BUF = (sdl2.SDL_Event * _EVT_BATCH)()
+
+# Frame pacing: pump events and redraw at most once per 60 Hz frame
+FRAME_NS = 16_666_667
+
+# Frame-invariant window rect and clear color, built once
+WINDOW_RECT = pymui.rect(50, 50, 400, 300)
+CLEAR_COLOR = pymui.color(32, 32, 32, 255)
+
+
+# Status labels are formatted once per distinct value, not once per frame
+@lru_cache(maxsize=1)
+def _textbox1_label(text):
+    return f"Textbox 1: '{text}'"
+
+
+@lru_cache(maxsize=1)
+def _textbox2_label(text):
+    return f"Textbox 2: '{text}'"
+
+
+@lru_cache(maxsize=1)
+def _submissions_label(count):
+    return f"Submissions: {count}"
+
 
 def main():
     """Test text input with focus handling"""
@@ -20,6 +58,8 @@ def main():
     if sdl2.SDL_Init(sdl2.SDL_INIT_EVERYTHING) != 0:
         print(f"SDL_Init Error: {sdl2.SDL_GetError()}")
         return 1
+    # Joystick, touch, sensor and drop events are never read here
+    disable_unused_events()
 
     try:
         print("Initializing renderer...")
@@ -31,106 +71,197 @@ def main():
 
         running = True
         text_buf = ""
+        text_buf2 = ""
         text_submissions = 0
 
+        # Constants and context methods the handlers use, bound to locals
+        ESC = sdl2.SDLK_ESCAPE
+        RETURN = sdl2.SDLK_RETURN
+        BACKSPACE = sdl2.SDLK_BACKSPACE
+        BTN_LEFT = sdl2.SDL_BUTTON_LEFT
+        MOUSE_LEFT = pymui.Mouse.LEFT
+        KEY_RETURN = pymui.Key.RETURN
+        KEY_BACKSPACE = pymui.Key.BACKSPACE
+        SUBMIT = pymui.Result.SUBMIT
+        mmove = ctx.input_mousemove
+        mdown = ctx.input_mousedown
+        mup = ctx.input_mouseup
+        kdown = ctx.input_keydown
+        text_in = ctx.input_text
+
+        # Event handlers, looked up by event type; a handler returns True to
+        # stop the loop
+        def on_quit(event):
+            print("Quit event received")
+            return True
+
+        def on_keydown(event):
+            sym = event.key.keysym.sym
+            if sym == ESC:
+                print("Escape pressed")
+                return True
+            # Handle special keys
+            if sym == RETURN:
+                if DEBUG:
+                    log.debug("Return key pressed")
+                kdown(KEY_RETURN)
+            elif sym == BACKSPACE:
+                if DEBUG:
+                    log.debug("Backspace key pressed")
+                kdown(KEY_BACKSPACE)
+            return False
+
+        def on_motion(event):
+            mmove(event.motion.x, event.motion.y)
+            return False
+
+        def on_mousedown(event):
+            if event.button.button == BTN_LEFT:
+                if DEBUG:
+                    log.debug("Mouse click at (%d, %d)", event.button.x, event.button.y)
+                mdown(event.button.x, event.button.y, MOUSE_LEFT)
+            return False
+
+        def on_mouseup(event):
+            if event.button.button == BTN_LEFT:
+                mup(event.button.x, event.button.y, MOUSE_LEFT)
+            return False
+
+        def on_text(event):
+            # Read the NUL-terminated payload straight from the event buffer
+            text = ctypes.string_at(ctypes.addressof(event) + _TEXTINPUT_OFFSET).decode('utf-8', 'replace')
+            if DEBUG:
+                log.debug("Text input received: '%s'", text)
+            text_in(text)
+            return False
+
+        handlers = {
+            sdl2.SDL_QUIT: on_quit,
+            sdl2.SDL_KEYDOWN: on_keydown,
+            sdl2.SDL_MOUSEMOTION: on_motion,
+            sdl2.SDL_MOUSEBUTTONDOWN: on_mousedown,
+            sdl2.SDL_MOUSEBUTTONUP: on_mouseup,
+            sdl2.SDL_TEXTINPUT: on_text,
+        }
+        get_handler = handlers.get
+
+        # Event drain calls and constants, bound to locals for the loop
+        pump = sdl2.SDL_PumpEvents
+        peep = sdl2.SDL_PeepEvents
+        GETEVENT = sdl2.SDL_GETEVENT
+        FIRSTEVENT = sdl2.SDL_FIRSTEVENT
+        LASTEVENT = sdl2.SDL_LASTEVENT
+
+        wait = sdl2.SDL_WaitEventTimeout
+        dirty = True
+        # SDL only emits text input while a textbox is focused; it starts
+        # out enabled on desktop platforms, so switch it off until then
+        sdl2.SDL_StopTextInput()
+        text_active = False
+        textbox_ids = ()
+        last_present = 0.0
+        next_tick = time.monotonic_ns()
         while running:
+            # When idle, block until input arrives (or 16ms pass) instead of
+            # rebuilding an unchanged UI; the event stays queued for the
+            # drain, and pacing restarts from now so input is not delayed
+            if not dirty:
+                wait(None, 16)
+                next_tick = time.monotonic_ns()
+
+            # Wait out the rest of the frame before pumping again, resyncing
+            # after stalls instead of running catch-up iterations
+            delay = next_tick - time.monotonic_ns()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+            elif delay < -FRAME_NS:
+                next_tick = time.monotonic_ns()
+            next_tick += FRAME_NS
+
             # Handle SDL events
-            event = sdl2.SDL_Event()
-            while sdl2.SDL_PollEvent(ctypes.byref(event)):
-                if event.type == sdl2.SDL_QUIT:
-                    print("Quit event received")
-                    running = False
-                elif event.type == sdl2.SDL_KEYDOWN and event.key.keysym.sym == sdl2.SDLK_ESCAPE:
-                    print("Escape pressed")
-                    running = False
-                elif event.type == sdl2.SDL_MOUSEMOTION:
-                    ctx.input_mousemove(event.motion.x, event.motion.y)
-                elif event.type == sdl2.SDL_MOUSEBUTTONDOWN:
-                    btn = pymui.Mouse.LEFT if event.button.button == sdl2.SDL_BUTTON_LEFT else 0
-                    if btn:
-                        print(f"Mouse click at ({event.button.x}, {event.button.y})")
-                        ctx.input_mousedown(event.button.x, event.button.y, btn)
-                elif event.type == sdl2.SDL_MOUSEBUTTONUP:
-                    btn = pymui.Mouse.LEFT if event.button.button == sdl2.SDL_BUTTON_LEFT else 0
-                    if btn:
-                        ctx.input_mouseup(event.button.x, event.button.y, btn)
-                elif event.type == sdl2.SDL_TEXTINPUT:
-                    # Convert bytes to string properly
-                    text_bytes = event.text.text
-                    # Find null terminator
-                    null_pos = text_bytes.find(b'\x00')
-                    if null_pos >= 0:
-                        text_bytes = text_bytes[:null_pos]
-                    text = text_bytes.decode('utf-8', errors='replace')
-                    print(f"Text input received: '{text}'")
-                    ctx.input_text(text)
-                elif event.type == sdl2.SDL_KEYDOWN:
-                    # Handle special keys
-                    if event.key.keysym.sym == sdl2.SDLK_RETURN:
-                        print("Return key pressed")
-                        ctx.input_keydown(pymui.Key.RETURN)
-                    elif event.key.keysym.sym == sdl2.SDLK_BACKSPACE:
-                        print("Backspace key pressed")
-                        ctx.input_keydown(pymui.Key.BACKSPACE)
+            pump()
+            while True:
+                n = peep(_EVT_BUF, _EVT_BATCH, GETEVENT, FIRSTEVENT, LASTEVENT)
+                if n < 0:
+                    print(f"SDL_PeepEvents Error: {sdl2.SDL_GetError()}")
+                    break
+                if n:
+                    dirty = True
+                for i in range(n):
+                    event = _EVT_BUF[i]
+                    handler = get_handler(event.type)
+                    if handler is not None and handler(event):
+                        running = False
+                if n < _EVT_BATCH:
+                    break
+
+            # Nothing new to show: skip the frame, apart from the periodic
+            # refresh below
+            now = time.monotonic()
+            if not dirty and now - last_present <= 1.0:
+                continue
 
             # Process frame
             ctx.begin()
 
             # Text input test with multiple textboxes
-            if ctx.begin_window("Text Input Focus Test", pymui.rect(50, 50, 400, 300)):
+            if ctx.begin_window("Text Input Focus Test", WINDOW_RECT):
                 ctx.label("Click on a textbox first, then type:")
                 
                 # First textbox
                 ctx.label("Textbox 1:")
                 result, text_buf = ctx.textbox_ex(text_buf, 128)
-                if result & pymui.Result.SUBMIT:
+                textbox1_id = ctx.get_last_id()
+                if result & SUBMIT:
                     text_submissions += 1
-                    print(f"*** TEXTBOX 1 SUBMITTED! Count: {text_submissions}, Text: '{text_buf}' ***")
+                    if DEBUG:
+                        log.debug("*** TEXTBOX 1 SUBMITTED! Count: %d, Text: '%s' ***", text_submissions, text_buf)
                 
                 # Second textbox
                 ctx.label("Textbox 2:")
-                if not hasattr(main, 'text_buf2'):
-                    main.text_buf2 = ""
-                result, main.text_buf2 = ctx.textbox_ex(main.text_buf2, 128)
-                if result & pymui.Result.SUBMIT:
+                result, text_buf2 = ctx.textbox_ex(text_buf2, 128)
+                textbox_ids = (textbox1_id, ctx.get_last_id())
+                if result & SUBMIT:
                     text_submissions += 1
-                    print(f"*** TEXTBOX 2 SUBMITTED! Count: {text_submissions}, Text: '{main.text_buf2}' ***")
+                    if DEBUG:
+                        log.debug("*** TEXTBOX 2 SUBMITTED! Count: %d, Text: '%s' ***", text_submissions, text_buf2)
                 
                 if ctx.button("Submit All"):
                     text_submissions += 1
-                    print(f"*** SUBMIT BUTTON CLICKED! Count: {text_submissions} ***")
-                    print(f"Textbox 1: '{text_buf}'")
-                    print(f"Textbox 2: '{main.text_buf2}'")
+                    if DEBUG:
+                        log.debug("*** SUBMIT BUTTON CLICKED! Count: %d ***", text_submissions)
+                        log.debug("Textbox 1: '%s'", text_buf)
+                        log.debug("Textbox 2: '%s'", text_buf2)
                 
                 # Show current values
-                ctx.label(f"Textbox 1: '{text_buf}'")
-                ctx.label(f"Textbox 2: '{main.text_buf2}'")
-                ctx.label(f"Submissions: {text_submissions}")
+                ctx.label(_textbox1_label(text_buf))
+                ctx.label(_textbox2_label(text_buf2))
+                ctx.label(_submissions_label(text_submissions))
                 
                 ctx.end_window()
 
             ctx.end()
 
-            # Render
-            pymui.renderer_clear(pymui.color(32, 32, 32, 255))
+            # Buttons and title bars also hold focus while the mouse is
+            # down, so compare against the textboxes' own IDs
+            if (ctx.get_focus() in textbox_ids) != text_active:
+                text_active = not text_active
+                if text_active:
+                    sdl2.SDL_StartTextInput()
+                else:
+                    sdl2.SDL_StopTextInput()
 
-            # Process commands
-            ctx.reset_command_iterator()
-            while True:
-                cmd = ctx.next_command()
-                if cmd is None:
-                    break
+            # Render only when the command list changed, refreshing once a
+            # second so the window stays responsive to the compositor
+            dirty = ctx.commands_changed()
+            if dirty or now - last_present > 1.0:
+                last_present = now
+                pymui.renderer_clear(CLEAR_COLOR)
 
-                if cmd.type == pymui.Command.TEXT:
-                    pymui.renderer_draw_text(cmd.text, cmd.pos, cmd.color)
-                elif cmd.type == pymui.Command.RECT:
-                    pymui.renderer_draw_rect(cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.ICON:
-                    pymui.renderer_draw_icon(cmd.icon_id, cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.CLIP:
-                    pymui.renderer_set_clip_rect(cmd.rect)
+                # Walk the command list in C and draw each command directly
+                pymui.render_all_commands(ctx)
 
-            pymui.renderer_present()
+                pymui.renderer_present()
 
         print(f"Test completed. Text submissions: {text_submissions}")
 
@@ -147,4 +278,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if DEBUG:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     sys.exit(main())
@@ -14,6 +14,10 @@ except ImportError:
     from pymui import pymui
 
 
+# Byte offset of the text payload within SDL_Event (text is a union member at 0)
+_TEXTINPUT_OFFSET = sdl2.SDL_TextInputEvent.text.offset
+
+
 def main():
     """Test textbox class with persistent state"""
     # Initialize SDL
@@ -34,10 +38,14 @@ def main():
         textbox2 = pymui.Textbox(128)
         text_submissions = 0
 
+        # SDL_PollEvent overwrites the event in place, so allocate it once
+        event = sdl2.SDL_Event()
+        event_ref = ctypes.byref(event)
+        # The text payload always sits at the same address in the reused event
+        text_addr = ctypes.addressof(event) + _TEXTINPUT_OFFSET
         while running:
             # Handle SDL events
-            event = sdl2.SDL_Event()
-            while sdl2.SDL_PollEvent(ctypes.byref(event)):
+            while sdl2.SDL_PollEvent(event_ref):
                 if event.type == sdl2.SDL_QUIT:
                     print("Quit event received")
                     running = False
@@ -56,13 +64,8 @@ def main():
                     if btn:
                         ctx.input_mouseup(event.button.x, event.button.y, btn)
                 elif event.type == sdl2.SDL_TEXTINPUT:
-                    # Convert bytes to string properly
-                    text_bytes = event.text.text
-                    # Find null terminator
-                    null_pos = text_bytes.find(b'\x00')
-                    if null_pos >= 0:
-                        text_bytes = text_bytes[:null_pos]
-                    text = text_bytes.decode('utf-8', errors='replace')
+                    # Read the NUL-terminated payload straight from the event buffer
+                    text = ctypes.string_at(text_addr).decode('utf-8', 'replace')
                     print(f"Text input received: '{text}'")
                     ctx.input_text(text)
                 elif event.type == sdl2.SDL_KEYDOWN:
@@ -113,21 +116,8 @@ def main():
             # Render
             pymui.renderer_clear(pymui.color(32, 32, 32, 255))
 
-            # Process commands
-            ctx.reset_command_iterator()
-            while True:
-                cmd = ctx.next_command()
-                if cmd is None:
-                    break
-
-                if cmd.type == pymui.Command.TEXT:
-                    pymui.renderer_draw_text(cmd.text, cmd.pos, cmd.color)
-                elif cmd.type == pymui.Command.RECT:
-                    pymui.renderer_draw_rect(cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.ICON:
-                    pymui.renderer_draw_icon(cmd.icon_id, cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.CLIP:
-                    pymui.renderer_set_clip_rect(cmd.rect)
+            # Walk the command list in C and draw each command directly
+            pymui.render_all_commands(ctx)
 
             pymui.renderer_present()
 
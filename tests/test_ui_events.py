@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 
+import logging
+import os
 import sys
+import time
 import sdl2
-import sdl2.ext
+from functools import lru_cache
 from pathlib import Path
 
 ROOTDIR = Path(__file__).parent.parent / "src"
@@ -13,65 +16,87 @@ except ImportError:
     sys.path.insert(0, str(ROOTDIR))
     from pymui import pymui
 
+from _sdl_harness import disable_unused_events
+
+
+# Per-event debug output is off by default; set PYMUI_DEBUG=1 to enable it
+DEBUG = os.environ.get("PYMUI_DEBUG") == "1"
+log = logging.getLogger(__name__)
+
+# Frame pacing: pump events and redraw at most once per 60 Hz frame
+FRAME_NS = 16_666_667
+
+# Longest idle wait for input inside run_frame(); matches the refresh period
+IDLE_WAIT_MS = 1000
+
+# Frame-invariant window rect and clear color, built once
+WINDOW_RECT = pymui.rect(50, 50, 300, 200)
+CLEAR_COLOR = pymui.color(64, 64, 64, 255)
+
+
+# Static labels, pre-encoded so label()/button()/checkbox() pass them
+# straight to microui without encoding them every frame
+SLIDER_LABEL = b"Slider:"
+CHECKBOX_LABEL = b"Checkbox:"
+CHECK_TEXT = b"Test Check"
+BUTTON_TEXT = b"Test Button"
+
+
+# Status labels are formatted and encoded once per distinct value, not
+# once per frame
+@lru_cache(maxsize=1)
+def _slider_label(value):
+    return f"Slider value: {value:.2f}".encode()
+
+
+@lru_cache(maxsize=1)
+def _checkbox_label(state):
+    return f"Checkbox state: {state}".encode()
 
-# SDL button mapping
-button_map = {
-    sdl2.SDL_BUTTON_LEFT: pymui.Mouse.LEFT,
-    sdl2.SDL_BUTTON_RIGHT: pymui.Mouse.RIGHT,
-    sdl2.SDL_BUTTON_MIDDLE: pymui.Mouse.MIDDLE,
-}
-
-# SDL key mapping
-key_map = {
-    sdl2.SDLK_LSHIFT: pymui.Key.SHIFT,
-    sdl2.SDLK_RSHIFT: pymui.Key.SHIFT,
-    sdl2.SDLK_LCTRL: pymui.Key.CTRL,
-    sdl2.SDLK_RCTRL: pymui.Key.CTRL,
-    sdl2.SDLK_LALT: pymui.Key.ALT,
-    sdl2.SDLK_RALT: pymui.Key.ALT,
-    sdl2.SDLK_RETURN: pymui.Key.RETURN,
-    sdl2.SDLK_BACKSPACE: pymui.Key.BACKSPACE,
-}
 
 # Global test state
 slider_val = 50.0
 checkbox_state = False
 
-def test_ui_window(ctx):
-    """Test window with sliders and checkboxes"""
+def build_ui(ctx):
+    """Test window with sliders and checkboxes (run between begin/end)"""
     global slider_val, checkbox_state
 
-    # Properly initialize frame
-    ctx.begin()
-
-    if ctx.begin_window("UI Test", pymui.rect(50, 50, 300, 200)):
+    if ctx.begin_window("UI Test", WINDOW_RECT):
         ctx.layout_row([100, -1], 0)
 
         # Test slider
-        ctx.label("Slider:")
+        ctx.label(SLIDER_LABEL)
         result, new_val = ctx.slider(slider_val, 0.0, 100.0)
         if result & pymui.Result.CHANGE:
-            print(f"Slider changed from {slider_val} to {new_val}")
+            if DEBUG:
+                log.debug("Slider changed from %s to %s", slider_val, new_val)
             slider_val = new_val
 
         # Test checkbox
-        ctx.label("Checkbox:")
-        result, new_state = ctx.checkbox("Test Check", checkbox_state)
+        ctx.label(CHECKBOX_LABEL)
+        result, new_state = ctx.checkbox(CHECK_TEXT, checkbox_state)
         if result & pymui.Result.CHANGE:
-            print(f"Checkbox changed from {checkbox_state} to {new_state}")
+            if DEBUG:
+                log.debug("Checkbox changed from %s to %s", checkbox_state, new_state)
             checkbox_state = new_state
 
         # Test button for comparison
-        if ctx.button("Test Button"):
-            print("Button clicked!")
+        if ctx.button(BUTTON_TEXT):
+            if DEBUG:
+                log.debug("Button clicked!")
 
         # Show current values
-        ctx.label(f"Slider value: {slider_val:.2f}")
-        ctx.label(f"Checkbox state: {checkbox_state}")
+        ctx.label(_slider_label(slider_val))
+        ctx.label(_checkbox_label(checkbox_state))
 
         ctx.end_window()
 
-    # Properly end frame
+
+def test_ui_window(ctx):
+    """Build the test window in a standalone frame"""
+    ctx.begin()
+    build_ui(ctx)
     ctx.end()
 
 
@@ -81,6 +106,8 @@ def main():
     if sdl2.SDL_Init(sdl2.SDL_INIT_EVERYTHING) != 0:
         print(f"SDL_Init Error: {sdl2.SDL_GetError()}")
         return 1
+    # Joystick, touch, sensor and drop events are never read here
+    disable_unused_events()
 
     try:
         # Initialize renderer
@@ -93,68 +120,33 @@ def main():
         print("Try moving the slider, clicking the checkbox, and clicking the button")
         print("Press Escape or close window to exit")
 
-        # Main loop
+        # Main loop: each run_frame() polls and forwards input, builds the
+        # UI via build_ui and draws it in one call, so only the UI
+        # callback runs in Python
+        run_frame = pymui.run_frame
         running = True
-        frame_count = 0
-
+        next_refresh = 0.0
+        next_tick = time.monotonic_ns()
         while running:
-            frame_count += 1
-
-            # Handle SDL events
-            events = sdl2.ext.get_events()
-            for event in events:
-                if event.type == sdl2.SDL_QUIT:
-                    running = False
-                elif event.type == sdl2.SDLK_ESCAPE:
-                    running = False
-                elif event.type == sdl2.SDL_MOUSEMOTION:
-                    ctx.input_mousemove(event.motion.x, event.motion.y)
-                elif event.type == sdl2.SDL_MOUSEWHEEL:
-                    ctx.input_scroll(0, event.wheel.y * -30)
-                elif event.type == sdl2.SDL_TEXTINPUT:
-                    text = event.text.text.decode('utf-8', errors='replace')
-                    ctx.input_text(text)
-                elif event.type in (sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP):
-                    btn = button_map.get(event.button.button)
-                    if btn:
-                        print(f"Mouse {'down' if event.type == sdl2.SDL_MOUSEBUTTONDOWN else 'up'} at ({event.button.x}, {event.button.y})")
-                        if event.type == sdl2.SDL_MOUSEBUTTONDOWN:
-                            ctx.input_mousedown(event.button.x, event.button.y, btn)
-                        else:
-                            ctx.input_mouseup(event.button.x, event.button.y, btn)
-                elif event.type in (sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP):
-                    key = key_map.get(event.key.keysym.sym)
-                    if key:
-                        if event.type == sdl2.SDL_KEYDOWN:
-                            ctx.input_keydown(key)
-                        else:
-                            ctx.input_keyup(key)
-
-            # Process frame
-            ctx.begin()
-            test_ui_window(ctx)
-            ctx.end()
-
-            # Render
-            pymui.renderer_clear(pymui.color(64, 64, 64, 255))
-
-            # Process commands
-            ctx.reset_command_iterator()
-            while True:
-                cmd = ctx.next_command()
-                if cmd is None:
-                    break
-
-                if cmd.type == pymui.Command.TEXT:
-                    pymui.renderer_draw_text(cmd.text.encode('utf-8'), cmd.pos, cmd.color)
-                elif cmd.type == pymui.Command.RECT:
-                    pymui.renderer_draw_rect(cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.ICON:
-                    pymui.renderer_draw_icon(cmd.icon_id, cmd.rect, cmd.color)
-                elif cmd.type == pymui.Command.CLIP:
-                    pymui.renderer_set_clip_rect(cmd.rect)
-
-            pymui.renderer_present()
+            # Wait out the rest of the frame before pumping again, resyncing
+            # after stalls instead of running catch-up iterations
+            delay = next_tick - time.monotonic_ns()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+            elif delay < -FRAME_NS:
+                next_tick = time.monotonic_ns()
+            next_tick += FRAME_NS
+
+            # Frames are presented only when the command list changed, plus
+            # once a second so the window stays responsive to the compositor
+            now = time.monotonic()
+            force = now >= next_refresh
+            if force:
+                next_refresh = now + 1.0
+
+            # Once the UI has settled, run_frame() blocks until input arrives
+            # (or the next refresh is due) instead of rebuilding it at 60 Hz
+            running = run_frame(ctx, build_ui, CLEAR_COLOR, force, IDLE_WAIT_MS)
 
         print("Test completed")
 
@@ -171,4 +163,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if DEBUG:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     sys.exit(main())
\ No newline at end of file
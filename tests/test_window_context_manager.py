@@ -17,13 +17,16 @@ sys.path.insert(0, str(ROOTDIR))
 import pytest
 import pymui
 
+# Rect for the manual begin_window() comparisons, built once
+MANUAL_RECT = pymui.Rect(10, 10, 100, 100)
+
 
 class TestWindowContextManager:
     """Test Window context manager functionality."""
 
-    def test_window_context_manager_basic_usage(self):
+    def test_window_context_manager_basic_usage(self, shared_ctx):
         """Test basic window context manager usage."""
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             # Create window using context manager
             with ctx.window("Test Window", 10, 10, 200, 150) as window:
                 # Verify that window is the Window object
@@ -32,9 +35,9 @@ class TestWindowContextManager:
                 # Note: We can't test actual window operations due to microui assertions
                 # but we can verify the context manager protocol works
 
-    def test_window_context_manager_convenience_method(self):
+    def test_window_context_manager_convenience_method(self, shared_ctx):
         """Test the convenience window() method on Context."""
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             # Test that window() method returns a Window object
             window_mgr = ctx.window("Test", 0, 0, 100, 100)
             assert window_mgr is not None
@@ -45,9 +48,9 @@ class TestWindowContextManager:
             assert hasattr(window_mgr, 'opt')
             assert hasattr(window_mgr, 'is_open')
 
-    def test_window_context_manager_parameters(self):
+    def test_window_context_manager_parameters(self, shared_ctx):
         """Test window context manager with various parameters."""
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             # Test with different parameters
             with ctx.window("My Window", 50, 100, 300, 200, 0) as window:
                 # Verify the parameters were stored correctly
@@ -58,12 +61,12 @@ class TestWindowContextManager:
                 assert window.rect.h == 200
                 assert window.opt == 0
 
-    def test_window_context_manager_exception_handling(self):
+    def test_window_context_manager_exception_handling(self, shared_ctx):
         """Test that end_window() is called even when exceptions occur."""
         exception_raised = False
 
         try:
-            with pymui.Context() as ctx:
+            with shared_ctx as ctx:
                 with ctx.window("Exception Test", 10, 10, 100, 100) as window:
                     # Verify window is created
                     assert hasattr(window, 'is_open')
@@ -75,15 +78,15 @@ class TestWindowContextManager:
         # Verify the exception was raised (not suppressed)
         assert exception_raised
 
-    def test_window_context_manager_vs_manual_usage(self):
+    def test_window_context_manager_vs_manual_usage(self, shared_ctx):
         """Test that window context manager is equivalent to manual begin/end."""
         # Both approaches should work equivalently
         # We can't test actual window content due to microui assertions,
         # but we can verify the context manager protocol
 
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             # Manual window management
-            result1 = ctx.begin_window("Manual", pymui.Rect(10, 10, 100, 100))
+            result1 = ctx.begin_window("Manual", MANUAL_RECT)
             if result1:
                 ctx.end_window()
 
@@ -92,9 +95,9 @@ class TestWindowContextManager:
                 # Both should work equivalently
                 assert hasattr(window, 'is_open')
 
-    def test_window_context_manager_nested_windows(self):
+    def test_window_context_manager_nested_windows(self, shared_ctx):
         """Test nested window context managers (though not typical usage)."""
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             with ctx.window("Outer Window", 10, 10, 200, 200) as outer:
                 assert hasattr(outer, 'is_open')
 
@@ -103,9 +106,9 @@ class TestWindowContextManager:
                 with ctx.window("Inner Window", 20, 20, 100, 100) as inner:
                     assert hasattr(inner, 'is_open')
 
-    def test_window_context_manager_multiple_sequential(self):
+    def test_window_context_manager_multiple_sequential(self, shared_ctx):
         """Test multiple sequential window context managers."""
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             # First window
             with ctx.window("Window 1", 10, 10, 100, 100) as window1:
                 assert window1.title == "Window 1"
@@ -116,18 +119,18 @@ class TestWindowContextManager:
                 assert window2.title == "Window 2"
                 assert window2.rect.x == 20
 
-    def test_window_context_manager_with_options(self):
+    def test_window_context_manager_with_options(self, shared_ctx):
         """Test window context manager with various options."""
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             # Test with different option flags
             test_opt = 1  # Some option flag
             with ctx.window("Options Test", 0, 0, 100, 100, test_opt) as window:
                 assert window.opt == test_opt
 
-    def test_window_context_manager_early_exit(self):
+    def test_window_context_manager_early_exit(self, shared_ctx):
         """Test window context manager with early exit (return, break, etc.)."""
         def function_with_early_return():
-            with pymui.Context() as ctx:
+            with shared_ctx as ctx:
                 with ctx.window("Early Exit", 0, 0, 100, 100) as window:
                     assert hasattr(window, 'is_open')
                     # Early return should still call __exit__
@@ -136,9 +139,9 @@ class TestWindowContextManager:
         result = function_with_early_return()
         assert result == "early_return_value"
 
-    def test_window_context_manager_window_properties(self):
+    def test_window_context_manager_window_properties(self, shared_ctx):
         """Test accessing window properties through context manager."""
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             with ctx.window("Property Test", 15, 25, 180, 120) as window:
                 # Test all accessible properties
                 assert window.title == "Property Test"
@@ -153,17 +156,17 @@ class TestWindowContextManager:
 class TestWindowContextManagerIntegration:
     """Test Window context manager integration with other features."""
 
-    def test_window_context_manager_with_unicode_titles(self):
+    def test_window_context_manager_with_unicode_titles(self, shared_ctx):
         """Test window context manager with unicode titles."""
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             # Test unicode title
             with ctx.window("🪟 Unicode Window", 10, 10, 150, 100) as window:
                 assert window.title == "🪟 Unicode Window"
 
-    def test_window_context_manager_error_scenarios(self):
+    def test_window_context_manager_error_scenarios(self, shared_ctx):
         """Test window context manager behavior in various error scenarios."""
 
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             # Test with assertion error
             with pytest.raises(AssertionError):
                 with ctx.window("Error Test", 0, 0, 100, 100) as window:
@@ -174,9 +177,9 @@ class TestWindowContextManagerIntegration:
                 with ctx.window("Error Test", 0, 0, 100, 100) as window:
                     raise ValueError("Intentional value error")
 
-    def test_window_context_manager_invalid_parameters(self):
+    def test_window_context_manager_invalid_parameters(self, shared_ctx):
         """Test window context manager with invalid parameters."""
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             # These should raise errors when begin_window is called
             # Test empty title (should raise ValueError when begin_window is called)
             with pytest.raises(ValueError):
@@ -192,10 +195,10 @@ class TestWindowContextManagerIntegration:
 class TestWindowContextManagerDocumentation:
     """Test that window context manager examples work as documented."""
 
-    def test_readme_style_window_example(self):
+    def test_readme_style_window_example(self, shared_ctx):
         """Test a README-style example using window context manager."""
         def create_simple_window():
-            with pymui.Context() as ctx:
+            with shared_ctx as ctx:
                 with ctx.window("My Application", 100, 100, 300, 200) as window:
                     if window.is_open:
                         # In a real app, you'd add UI elements here
@@ -213,13 +216,13 @@ class TestWindowContextManagerDocumentation:
             assert 'open' in result
             assert result['rect'].w == 300
 
-    def test_comparison_manual_vs_window_context_manager(self):
+    def test_comparison_manual_vs_window_context_manager(self, shared_ctx):
         """Test that manual and window context manager approaches work."""
 
         # Manual approach
         def manual_window_approach():
-            with pymui.Context() as ctx:
-                result = ctx.begin_window("Manual Window", pymui.Rect(10, 10, 100, 100))
+            with shared_ctx as ctx:
+                result = ctx.begin_window("Manual Window", MANUAL_RECT)
                 try:
                     if result:
                         # Window content would go here
@@ -231,7 +234,7 @@ class TestWindowContextManagerDocumentation:
 
         # Context manager approach
         def context_manager_window_approach():
-            with pymui.Context() as ctx:
+            with shared_ctx as ctx:
                 with ctx.window("Context Manager Window", 10, 10, 100, 100) as window:
                     if window.is_open:
                         # Same content would go here
@@ -245,9 +248,9 @@ class TestWindowContextManagerDocumentation:
         assert manual_result in ["manual_success", "manual_closed"]
         assert cm_result in ["context_manager_success", "context_manager_closed"]
 
-    def test_docstring_example(self):
+    def test_docstring_example(self, shared_ctx):
         """Test the exact example from the window context manager docstring."""
-        with pymui.Context() as ctx:
+        with shared_ctx as ctx:
             with ctx.window("My Window", 10, 10, 200, 150) as window:
                 if window.is_open:
                     # We can't actually test label() due to microui assertions,